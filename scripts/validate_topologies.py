@@ -8,127 +8,256 @@ This script is used by CI to ensure all topologies:
 3. Follow Meraki API field requirements
 """
 
+import hashlib
+import io
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
 from pathlib import Path
+from typing import Callable, Iterator
+
+PROJECT_ROOT = Path(__file__).parent.parent
 
 # Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Passing validation results, keyed by topology sources plus this script
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'validate_topologies'
+RESULTS_FILE = CACHE_DIR / 'results.json'
+_VALIDATOR_SOURCE = Path(__file__).read_bytes()
+
+VALIDATION_SEED = 42
+
+# Required fields for a generated topology (Meraki API compliance).
+# Every item in an entity list must carry its section's required fields.
+_TOP_REQUIRED = ('topology_name', 'organizations', 'networks', 'devices', 'vlans')
+_ORG_REQUIRED = ('id', 'name', 'url', 'api', 'cloud')
+_NET_REQUIRED = ('id', 'organizationId', 'name', 'productTypes', 'timeZone',
+                 'tags', 'url', 'isBoundToConfigTemplate')
+_DEV_REQUIRED = ('serial', 'name', 'model', 'networkId', 'mac', 'productType',
+                 'firmware', 'lanIp', 'tags', 'lat', 'lng')
+_VLAN_REQUIRED = ('id', 'networkId', 'name', 'subnet', 'applianceIp')
+_CLIENT_REQUIRED = ('id', 'mac', 'ip', 'description', 'manufacturer',
+                    'deviceTypePrediction', 'status')
+
+TOPOLOGY_SCHEMA = {
+    'required': _TOP_REQUIRED,
+    'items': {
+        'organizations': ('Organization', _ORG_REQUIRED),
+        'networks': ('Network', _NET_REQUIRED),
+        'devices': ('Device', _DEV_REQUIRED),
+        'vlans': ('VLAN', _VLAN_REQUIRED),
+        'network_clients': ('Client', _CLIENT_REQUIRED),
+    },
+}
+
+# Embedded devices whose deviceTypePrediction has no OS info after the comma
+VALID_NO_COMMA_TYPES = frozenset({
+    'Cisco IP Phone', 'Cisco IP Phone 8845',
+    'HP LaserJet Printer', 'HP OfficeJet MFP',
+    'Canon Printer', 'Epson Printer',
+    'IoT Sensor', 'Environmental Sensor',
+    'Axis IP Camera', 'Axis P3245-V',
+    'Zebra Scanner', 'Zebra TC52',
+    'Honeywell Scanner', 'Honeywell CT60',
+    'GE Patient Monitor', 'GE CARESCAPE Monitor',
+    'Philips IntelliVue', 'Philips Patient Monitor',
+})
+
+
+def compile_schema(schema: dict) -> Callable[[dict], Iterator[str]]:
+    """Build a reusable validator that yields an error message per missing field."""
+    required = tuple(schema['required'])
+    items = tuple(
+        (section, label, tuple(fields), frozenset(fields))
+        for section, (label, fields) in schema['items'].items()
+    )
+
+    def validate(data: dict) -> Iterator[str]:
+        for field in required:
+            if field not in data:
+                yield f'Missing required field "{field}"'
+            elif not data[field]:
+                yield f'Field "{field}" is empty'
+
+        for section, label, fields, field_set in items:
+            entities = data.get(section)
+            if not entities:
+                continue
+            # Keys shared by every entity, computed with C-level set ops
+            common = set(entities[0]).intersection(*entities[1:])
+            # Fast path: a single subset check when nothing is missing
+            if field_set.issubset(common):
+                continue
+            for field in fields:
+                if field not in common:
+                    yield f'{label} missing field "{field}"'
+
+    return validate
+
+
+# Compiled once per process and shared by every topology
+VALIDATOR = compile_schema(TOPOLOGY_SCHEMA)
+
+
+def cached_import(module_name: str, item_name: str):
+    """Return an attribute from a module, importing it only if not already loaded."""
+    modules = sys.modules
+    if module_name not in modules:
+        import_module(module_name)
+    return getattr(modules[module_name], item_name)
+
+
+class LazyImport:
+    """Proxy for a dotted ``module.attribute`` path that imports on first use."""
+
+    __slots__ = ('dotted', '_target')
+
+    def __init__(self, dotted: str):
+        self.dotted = dotted
+        self._target = None
+
+    @property
+    def module_name(self) -> str:
+        return self.dotted.rsplit('.', 1)[0]
+
+    def _resolve(self):
+        if self._target is None:
+            module_name, item_name = self.dotted.rsplit('.', 1)
+            self._target = cached_import(module_name, item_name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __reduce__(self):
+        # Ship only the dotted path to worker processes, never the module
+        return (lazy_import, (self.dotted,))
+
+
+def lazy_import(dotted: str) -> LazyImport:
+    """Return a proxy that defers importing ``dotted`` until it is used."""
+    return LazyImport(dotted)
+
 
+def _source_key(module_path: str, seed: int) -> str:
+    """Hash the topology module and shared generators so edits invalidate cached results."""
+    digest = hashlib.sha256(str(seed).encode())
+    module_file = PROJECT_ROOT / (module_path.replace('.', '/') + '.py')
+    digest.update(module_file.read_bytes())
+    for generator_file in sorted((PROJECT_ROOT / 'seed_data' / 'generators').glob('*.py')):
+        digest.update(generator_file.read_bytes())
+    return digest.hexdigest()
 
-def validate_topology(name: str, module_path: str, func_name: str) -> list[str]:
-    """Validate a single topology and return list of errors."""
+
+def _validate_topology(name: str, generate_func: LazyImport) -> tuple[list[str], str]:
+    """Validate a single topology, returning its errors and buffered log output."""
     errors = []
+    buf = io.StringIO()
+    write = buf.write
 
-    print(f'\n=== Validating {name} topology ===')
+    write(f'\n=== Validating {name} topology ===\n')
 
     try:
-        module = __import__(module_path, fromlist=[func_name])
-        generate_func = getattr(module, func_name)
-
         # Generate topology with fixed seed for reproducibility
-        data = generate_func(seed=42)
+        data = generate_func(seed=VALIDATION_SEED)
+    except ImportError as e:
+        # Nothing further can be validated for a topology that won't import
+        write(f'  ✗ Import failed: {e}\n')
+        return [f'{name}: import failed: {e}'], buf.getvalue()
+    except Exception as e:
+        write(f'  ✗ Error: {e}\n')
+        return [f'{name}: {str(e)}'], buf.getvalue()
 
-        # Validate required top-level fields
-        required = ['topology_name', 'organizations', 'networks', 'devices', 'vlans']
-        for field in required:
-            if field not in data:
-                errors.append(f'{name}: Missing required field "{field}"')
-            elif not data[field]:
-                errors.append(f'{name}: Field "{field}" is empty')
+    try:
+        # Validate required fields
+        for message in VALIDATOR(data):
+            errors.append(f'{name}: {message}')
 
         # Print stats
         stats = data.get('stats', {})
-        print(f'  Organizations: {stats.get("organizations", len(data.get("organizations", [])))}')
-        print(f'  Networks: {stats.get("networks", len(data.get("networks", [])))}')
-        print(f'  Devices: {stats.get("devices", len(data.get("devices", [])))}')
-        print(f'  VLANs: {stats.get("vlans", len(data.get("vlans", [])))}')
-        print(f'  Clients: {stats.get("clients", len(data.get("network_clients", [])))}')
-
-        # Validate Organization fields
-        if data.get('organizations'):
-            org = data['organizations'][0]
-            org_required = ['id', 'name', 'url', 'api', 'cloud']
-            for field in org_required:
-                if field not in org:
-                    errors.append(f'{name}: Organization missing field "{field}"')
-
-        # Validate Network fields (Meraki API compliance)
-        if data.get('networks'):
-            net = data['networks'][0]
-            net_required = ['id', 'organizationId', 'name', 'productTypes', 'timeZone',
-                          'tags', 'url', 'isBoundToConfigTemplate']
-            for field in net_required:
-                if field not in net:
-                    errors.append(f'{name}: Network missing field "{field}"')
-
-        # Validate Device fields
-        if data.get('devices'):
-            dev = data['devices'][0]
-            dev_required = ['serial', 'name', 'model', 'networkId', 'mac', 'productType',
-                          'firmware', 'lanIp', 'tags', 'lat', 'lng']
-            for field in dev_required:
-                if field not in dev:
-                    errors.append(f'{name}: Device missing field "{field}"')
-
-        # Validate VLAN fields
-        if data.get('vlans'):
-            vlan = data['vlans'][0]
-            vlan_required = ['id', 'networkId', 'name', 'subnet', 'applianceIp']
-            for field in vlan_required:
-                if field not in vlan:
-                    errors.append(f'{name}: VLAN missing field "{field}"')
-
-        # Validate Client fields
+        write(f'  Organizations: {stats.get("organizations", len(data.get("organizations", [])))}\n')
+        write(f'  Networks: {stats.get("networks", len(data.get("networks", [])))}\n')
+        write(f'  Devices: {stats.get("devices", len(data.get("devices", [])))}\n')
+        write(f'  VLANs: {stats.get("vlans", len(data.get("vlans", [])))}\n')
+        write(f'  Clients: {stats.get("clients", len(data.get("network_clients", [])))}\n')
+
         if data.get('network_clients'):
             client = data['network_clients'][0]
-            client_required = ['id', 'mac', 'ip', 'description', 'manufacturer',
-                             'deviceTypePrediction', 'status']
-            for field in client_required:
-                if field not in client:
-                    errors.append(f'{name}: Client missing field "{field}"')
 
             # Check deviceTypePrediction format (should contain comma for Meraki format)
             # Exception: Some embedded devices don't have OS info after the comma
             dtp = client.get('deviceTypePrediction', '')
-            valid_no_comma_types = [
-                'Cisco IP Phone', 'Cisco IP Phone 8845',
-                'HP LaserJet Printer', 'HP OfficeJet MFP',
-                'Canon Printer', 'Epson Printer',
-                'IoT Sensor', 'Environmental Sensor',
-                'Axis IP Camera', 'Axis P3245-V',
-                'Zebra Scanner', 'Zebra TC52',
-                'Honeywell Scanner', 'Honeywell CT60',
-                'GE Patient Monitor', 'GE CARESCAPE Monitor',
-                'Philips IntelliVue', 'Philips Patient Monitor',
-            ]
-            if dtp and ',' not in dtp and dtp not in valid_no_comma_types:
-                print(f'  Warning: deviceTypePrediction "{dtp}" may not be in Meraki format')
+            if dtp and ',' not in dtp and dtp not in VALID_NO_COMMA_TYPES:
+                write(f'  Warning: deviceTypePrediction "{dtp}" may not be in Meraki format\n')
 
         if not errors:
-            print(f'  ✓ Topology "{name}" is valid')
+            write(f'  ✓ Topology "{name}" is valid\n')
 
     except Exception as e:
         errors.append(f'{name}: {str(e)}')
-        print(f'  ✗ Error: {e}')
+        write(f'  ✗ Error: {e}\n')
+
+    return errors, buf.getvalue()
 
-    return errors
 
+def _result_key(generate_func: LazyImport) -> str:
+    """Key a validation result on the topology sources, the validator and the interpreter."""
+    digest = hashlib.sha256(_source_key(generate_func.module_name, VALIDATION_SEED).encode())
+    digest.update(_VALIDATOR_SOURCE)
+    # A pass under one interpreter says nothing about whether the sources import under another
+    digest.update(f'{sys.implementation.name}-{sys.version_info[:3]}'.encode())
+    return digest.hexdigest()
 
-def discover_topologies() -> list[tuple[str, str, str]]:
+
+def _load_results() -> dict:
+    """Load cached validation results, ignoring a missing or unreadable file."""
+    try:
+        with RESULTS_FILE.open() as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_results(results: dict):
+    """Persist validation results (best-effort)."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with RESULTS_FILE.open('w') as f:
+            json.dump(results, f)
+    except OSError:
+        pass
+
+
+def _validate_worker(args: tuple[str, LazyImport]) -> tuple[list[str], str]:
+    """Validate a topology in a worker process, returning its output for the parent."""
+    name, generate_func = args
+    return _validate_topology(name, generate_func)
+
+
+def discover_topologies() -> list[tuple[str, LazyImport]]:
     """Discover all topology files in seed_data/topologies/"""
     topologies = []
-    topology_dir = Path('seed_data/topologies')
 
-    for py_file in topology_dir.glob('*.py'):
-        if py_file.name.startswith('_'):
-            continue
+    with os.scandir('seed_data/topologies') as it:
+        for entry in it:
+            file_name = entry.name
+            if not file_name.endswith('.py') or file_name.startswith('_'):
+                continue
 
-        module_name = py_file.stem
-        module_path = f'seed_data.topologies.{module_name}'
-        func_name = f'generate_{module_name}_topology'
+            module_name = file_name[:-3]
+            module_path = f'seed_data.topologies.{module_name}'
+            func_name = f'generate_{module_name}_topology'
 
-        topologies.append((module_name, module_path, func_name))
+            topologies.append((module_name, lazy_import(f'{module_path}.{func_name}')))
 
+    # scandir order is filesystem-dependent; keep CI output stable
+    topologies.sort(key=lambda t: t[0])
     return topologies
 
 
@@ -143,10 +272,34 @@ def main():
 
     all_errors = []
 
-    for name, module_path, func_name in topologies:
-        errors = validate_topology(name, module_path, func_name)
+    # Skip topologies whose sources and validator are unchanged since they last passed
+    cached_results = _load_results()
+    keys = [_result_key(generate_func) for _, generate_func in topologies]
+    pending = [t for t, key in zip(topologies, keys) if key not in cached_results]
+
+    # Generators are CPU-bound and independent, so run them in parallel
+    if len(pending) <= 1:
+        fresh = [_validate_worker(t) for t in pending]
+    else:
+        sys.stdout.flush()
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            fresh = list(ex.map(_validate_worker, pending))
+    fresh = iter(fresh)
+
+    # Flush buffered output in discovery order
+    for key in keys:
+        if key in cached_results:
+            errors, log = [], cached_results[key]
+        else:
+            errors, log = next(fresh)
+            if not errors:
+                cached_results[key] = log
+        sys.stdout.write(log)
         all_errors.extend(errors)
 
+    # Drop results for sources that no longer exist
+    _save_results({key: cached_results[key] for key in keys if key in cached_results})
+
     print("\n" + "=" * 60)
 
     if all_errors:
@@ -9,8 +9,13 @@ Generates realistic client data including:
 """
 
 import random
+import re
 import string
-from datetime import datetime, timedelta
+import sys
+import time
+from itertools import accumulate
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 # Client manufacturers with realistic distributions and VERIFIED OUI prefixes
@@ -92,19 +97,370 @@ DEVICE_TYPE_BY_KEY = {
 # Build reverse lookup: OUI -> manufacturer entry (for required_manufacturers)
 MANUFACTURER_BY_OUI = {m["oui"]: m for m in CLIENT_MANUFACTURERS}
 
-# Device types with usage patterns
-DEVICE_TYPES = [
-    {"type": "Laptop", "weight": 35, "sent_range": (500_000_000, 5_000_000_000), "recv_range": (1_000_000_000, 10_000_000_000)},
-    {"type": "Smartphone", "weight": 25, "sent_range": (50_000_000, 500_000_000), "recv_range": (200_000_000, 2_000_000_000)},
-    {"type": "Desktop", "weight": 15, "sent_range": (1_000_000_000, 10_000_000_000), "recv_range": (2_000_000_000, 20_000_000_000)},
-    {"type": "Tablet", "weight": 10, "sent_range": (100_000_000, 1_000_000_000), "recv_range": (500_000_000, 5_000_000_000)},
-    {"type": "Printer", "weight": 5, "sent_range": (1_000_000, 50_000_000), "recv_range": (10_000_000, 100_000_000)},
-    {"type": "VoIP Phone", "weight": 5, "sent_range": (500_000_000, 2_000_000_000), "recv_range": (500_000_000, 2_000_000_000)},
-    {"type": "IoT Sensor", "weight": 3, "sent_range": (1_000_000, 10_000_000), "recv_range": (5_000_000, 50_000_000)},
-    {"type": "Camera", "weight": 2, "sent_range": (5_000_000_000, 50_000_000_000), "recv_range": (10_000_000, 100_000_000)},
-    {"type": "Smart TV", "weight": 3, "sent_range": (100_000_000, 500_000_000), "recv_range": (2_000_000_000, 20_000_000_000)},  # High download for streaming
-    {"type": "Medical Device", "weight": 1, "sent_range": (10_000_000, 100_000_000), "recv_range": (50_000_000, 500_000_000)},  # Moderate, critical traffic
-]
+# Device type key -> manufacturer entry, resolved once for required_manufacturers
+REQUIRED_KEY_TO_MFR = {
+    k: MANUFACTURER_BY_OUI[oui] for k, oui in DEVICE_TYPE_BY_KEY.items() if oui in MANUFACTURER_BY_OUI
+}
+
+# Map OUI to hostname prefixes with Meraki-style device type predictions
+# Meraki returns detailed strings like "iPhone SE, iOS9.3.5"
+# Using OUI allows us to distinguish device types even with same manufacturer name
+_PREFIXES_BY_OUI = {
+    # Apple Mobile (iPhone/iPad) - OUI: 3C:E0:72
+    "3C:E0:72": (
+        ("IPHONE", "iPhone, %s"),
+        ("IPAD", "iPad, %s"),
+    ),
+    # Apple Mac (MacBook/iMac) - OUI: A4:83:E7
+    "A4:83:E7": (
+        ("MACBOOK", "MacBook Pro, %s"),
+        ("IMAC", "iMac, %s"),
+    ),
+    # Samsung Mobile (phones/tablets) - OUI: 84:25:DB
+    "84:25:DB": (
+        ("GALAXY", "Samsung Galaxy, %s"),
+        ("SAMSUNG-TAB", "Samsung Tablet, %s"),
+    ),
+    # Samsung TV - OUI: 8C:79:F5
+    "8C:79:F5": (
+        ("SAMSUNG-TV", "Samsung Smart TV, %s"),
+        ("SMARTTV", "Samsung Smart TV, %s"),
+    ),
+    # Dell - OUI: F8:B1:56
+    "F8:B1:56": (
+        ("DELL-LAPTOP", "Dell Laptop, %s"),
+        ("DELL-DESKTOP", "Dell Desktop, %s"),
+    ),
+    # HP Laptop - OUI: 10:B6:76
+    "10:B6:76": (
+        ("HP-LAPTOP", "HP Laptop, %s"),
+        ("HP-DESKTOP", "HP Desktop, %s"),
+    ),
+    # HP Printer - OUI: C8:B5:AD
+    "C8:B5:AD": (
+        ("HP-PRINTER", "HP LaserJet Printer"),
+        ("HP-MFP", "HP OfficeJet MFP"),
+    ),
+    # Lenovo - OUI: 28:D2:44
+    "28:D2:44": (
+        ("LENOVO", "Lenovo ThinkPad, %s"),
+        ("THINKPAD", "Lenovo ThinkPad, %s"),
+    ),
+    # Microsoft Surface - OUI: 28:18:78
+    "28:18:78": (
+        ("SURFACE", "Microsoft Surface, %s"),
+        ("DEVICE", "Windows PC, %s"),
+    ),
+    # Intel NUC - OUI: A4:34:D9
+    "A4:34:D9": (
+        ("DEVICE", "Intel NUC, %s"),
+    ),
+    # Google Pixel/Chromebook - OUI: F4:F5:D8
+    "F4:F5:D8": (
+        ("PIXEL", "Google Pixel, %s"),
+        ("CHROMEBOOK", "Chromebook, %s"),
+    ),
+    # Epson Printer - OUI: 00:26:AB
+    "00:26:AB": (
+        ("EPSON-PRINTER", "Epson Printer"),
+    ),
+    # Canon Printer - OUI: 00:1E:8F
+    "00:1E:8F": (
+        ("CANON-PRINTER", "Canon Printer"),
+    ),
+    # LG TV - OUI: A8:23:FE
+    "A8:23:FE": (
+        ("LG-TV", "LG Smart TV, %s"),
+        ("LGTV", "LG Smart TV, %s"),
+    ),
+    # Cisco VoIP - OUI: 00:1B:0D
+    "00:1B:0D": (
+        ("VOIP", "Cisco IP Phone"),
+        ("CISCO-PHONE", "Cisco IP Phone 8845"),
+    ),
+    # Zebra Scanner - OUI: 00:A0:F8
+    "00:A0:F8": (
+        ("ZEBRA-SCANNER", "Zebra Scanner"),
+        ("SCANNER", "Zebra TC52"),
+    ),
+    # Honeywell Scanner - OUI: 00:40:84
+    "00:40:84": (
+        ("HON-SCANNER", "Honeywell Scanner"),
+        ("SCANNER", "Honeywell CT60"),
+    ),
+    # Axis IP Camera - OUI: 00:40:8C
+    "00:40:8C": (
+        ("AXIS-CAM", "Axis IP Camera"),
+        ("CAMERA", "Axis P3245-V"),
+    ),
+    # Texas Instruments IoT Sensor - OUI: 00:17:E5
+    "00:17:E5": (
+        ("SENSOR", "IoT Sensor"),
+        ("TI-SENSOR", "Environmental Sensor"),
+    ),
+    # GE Healthcare - OUI: 00:00:9A
+    "00:00:9A": (
+        ("GE-MEDICAL", "GE Patient Monitor"),
+        ("GE-MONITOR", "GE CARESCAPE Monitor"),
+    ),
+    # Philips Healthcare - OUI: 00:1E:C0
+    "00:1E:C0": (
+        ("PHILIPS-MED", "Philips IntelliVue"),
+        ("PATIENT-MON", "Philips Patient Monitor"),
+    ),
+}
+
+# Fallback for OUIs without a known device type
+_DEFAULT_PREFIXES = (("DEVICE", "Unknown Device, %s"),)
+
+# Bandwidth usage ranges by device category
+USAGE_PATTERNS = {
+    "Computer": {"sent_range": (500_000_000, 5_000_000_000), "recv_range": (1_000_000_000, 10_000_000_000)},
+    "Phone": {"sent_range": (50_000_000, 500_000_000), "recv_range": (200_000_000, 2_000_000_000)},
+    "Tablet": {"sent_range": (100_000_000, 1_000_000_000), "recv_range": (500_000_000, 5_000_000_000)},
+    "Printer": {"sent_range": (1_000_000, 50_000_000), "recv_range": (10_000_000, 100_000_000)},
+    "VoIP phone": {"sent_range": (500_000_000, 2_000_000_000), "recv_range": (500_000_000, 2_000_000_000)},
+    "IP camera": {"sent_range": (5_000_000_000, 50_000_000_000), "recv_range": (10_000_000, 100_000_000)},
+    "Smart TV": {"sent_range": (100_000_000, 500_000_000), "recv_range": (2_000_000_000, 20_000_000_000)},  # High download for streaming
+    "Medical": {"sent_range": (10_000_000, 100_000_000), "recv_range": (50_000_000, 500_000_000)},  # Moderate, critical traffic
+    "Other": {"sent_range": (1_000_000, 100_000_000), "recv_range": (5_000_000, 200_000_000)},
+}
+
+
+# USAGE_PATTERNS flattened to (sent_lo, sent_hi, recv_lo, recv_hi) rows, indexed by category
+_USAGE_INDEX = {name: i for i, name in enumerate(USAGE_PATTERNS)}
+_USAGE_TABLE = tuple((*p["sent_range"], *p["recv_range"]) for p in USAGE_PATTERNS.values())
+
+
+# deviceTypePrediction keywords (lowercase) for each usage category, in precedence order.
+# Predictions are detailed strings like "iPhone, iOS 17", so they never equal a category name
+_USAGE_KEYWORDS = (
+    ("Smart TV", ("smart tv", "television", "tizen", "webos")),
+    ("Medical", ("medical", "patient", "healthcare", "intellivue", "carescape")),
+    ("VoIP phone", ("ip phone", "voip")),
+    ("IP camera", ("camera", "axis")),
+    ("Printer", ("printer", "laserjet", "officejet", "mfp")),
+    ("Tablet", ("ipad", "tablet")),
+    ("Phone", ("iphone", "galaxy", "pixel")),
+    ("Computer", ("laptop", "desktop", "macbook", "imac", "thinkpad", "surface", "chromebook", "nuc", "windows pc")),
+)
+
+
+def _usage_index_for(device_type_prediction: str) -> int:
+    """Pick the _USAGE_TABLE row for a deviceTypePrediction string."""
+    device_type_lower = device_type_prediction.lower() if device_type_prediction else ""
+    for category, keywords in _USAGE_KEYWORDS:
+        if any(k in device_type_lower for k in keywords):
+            return _USAGE_INDEX[category]
+    return _USAGE_INDEX.get(device_type_prediction, _USAGE_INDEX["Other"])
+
+
+# IoT device patterns matched against the hostname and deviceTypePrediction
+_IOT_HOST_RE = re.compile(
+    "PRINTER|SCANNER|SENSOR|CAMERA|VOIP|NUC|DEVICE-|SMARTTV|TV|GE-|PHILIPS-|PATIENT|MEDICAL|MONITOR"
+)
+_IOT_TYPE_RE = re.compile(
+    "printer|scanner|sensor|camera|ip phone|iot|intel nuc|smart tv|television|medical|patient|healthcare"
+)
+
+
+# Connection classes in precedence order: (wired probability, hostname keywords, type keywords).
+# Hostname keywords are uppercase and type keywords lowercase, matching how each is cased
+_CONNECTION_CLASSES = (
+    # Always wireless: phones, tablets (mobile devices)
+    (0.0,
+     ("IPHONE", "IPAD", "GALAXY", "PIXEL", "SAMSUNG-TAB", "TABLET"),
+     ("iphone", "ipad", "galaxy", "pixel", "tablet", "android")),
+    # Always wired: desktops, printers, scanners, VoIP, sensors, cameras, NUCs, medical devices
+    (1.0,
+     ("DESKTOP", "PRINTER", "SCANNER", "VOIP", "SENSOR", "CAMERA", "NUC", "GE-", "PHILIPS-", "PATIENT",
+      "MEDICAL", "CISCO-PHONE", "HP-PRINTER", "HP-MFP", "EPSON-", "CANON-", "AXIS-", "HON-", "ZEBRA-"),
+     ("desktop", "printer", "scanner", "ip phone", "voip", "sensor", "camera", "nuc", "medical", "patient",
+      "healthcare", "laserjet", "officejet", "intellivue", "carescape")),
+    # Smart TVs: 50% wired (ethernet for stable streaming), 50% wireless
+    (0.5,
+     ("SAMSUNG-TV", "LG-TV", "SMARTTV", "LGTV"),
+     ("smart tv", "television", "tizen", "webos")),
+)
+# Laptops, Chromebooks, MacBooks, ThinkPads, Surfaces - mix (40% wired, 60% wireless)
+_DEFAULT_WIRED_ODDS = 0.4
+
+# One keyword index over all classes: each match reports its class via the group name ("c<rank>").
+# The lookahead makes matches zero-width so overlapping keywords from every class are seen
+_CONNECTION_RE = re.compile("(?=(?:" + "|".join(
+    f"(?P<c{rank}>{'|'.join(map(re.escape, host + types))})"
+    for rank, (_, host, types) in enumerate(_CONNECTION_CLASSES)
+) + "))")
+
+
+def _hostname_prefix(hostname: str) -> str:
+    """Hostnames are "<PREFIX>-<random suffix>"; return the prefix (dash kept)."""
+    return hostname[:hostname.rfind("-") + 1] or hostname
+
+
+@lru_cache(maxsize=256)
+def _wired_odds(hostname: str, device_type_prediction: str) -> float:
+    """Probability that a client is wired, from its hostname prefix and deviceTypePrediction.
+
+    Phones and tablets are always wireless (0.0); desktops, printers, scanners, VoIP,
+    sensors, cameras, NUCs and medical devices are always wired (1.0). Smart TVs are
+    wired half the time and everything else (laptops etc.) 40% of the time.
+    """
+    # Single scan over both fields; case keeps hostname and type keywords apart
+    text = f"{hostname.upper()}\n{device_type_prediction.lower()}"
+    ranks = [int(m.lastgroup[1:]) for m in _CONNECTION_RE.finditer(text)]
+    return _CONNECTION_CLASSES[min(ranks)][0] if ranks else _DEFAULT_WIRED_ODDS
+
+
+def _assign_connections(clients: list, has_switches: bool, has_aps: bool) -> list[bool]:
+    """
+    Decide wired (True) or wireless (False) for each client in a network.
+
+    Args:
+        clients: Client records in generation order
+        has_switches: Whether the network has switches for wired clients
+        has_aps: Whether the network has APs for wireless clients
+
+    Returns:
+        One flag per client, in the same order
+    """
+    if not has_aps:
+        return [True] * len(clients)  # Force wired if no APs
+    if not has_switches:
+        return [False] * len(clients)  # Force wireless if no switches
+
+    # Based on DEVICE TYPE (realistic assignment); draw only for mixed device types.
+    # Classification is cached on the hostname prefix, so it runs once per device type
+    rand = random.random
+    is_wired = [False] * len(clients)
+    for i, client in enumerate(clients):
+        odds = _wired_odds(_hostname_prefix(client.description), client.deviceTypePrediction)
+        is_wired[i] = odds == 1.0 or (odds > 0.0 and rand() < odds)
+    return is_wired
+
+
+@lru_cache(maxsize=256)
+def _iot_classify(hostname_prefix: str, device_type_prediction: str) -> bool:
+    """Classify a (hostname prefix, deviceTypePrediction) pair as IoT or not."""
+    if _IOT_HOST_RE.search(hostname_prefix):
+        return True
+    return bool(device_type_prediction and _IOT_TYPE_RE.search(device_type_prediction.lower()))
+
+
+# Relative client share per VLAN: user/data VLANs carry most clients in real networks
+_BUSY_VLAN_KEYWORDS = ("corp", "data")
+_BUSY_VLAN_WEIGHT = 5
+
+
+def _vlan_weight(vlan: dict) -> int:
+    """Weight of a VLAN when distributing a network's clients across its VLANs."""
+    name = vlan.get("name", "").lower()
+    return _BUSY_VLAN_WEIGHT if any(k in name for k in _BUSY_VLAN_KEYWORDS) else 1
+
+
+# Map common VLAN IDs to descriptive names
+_NAMED_VLANS = {
+    1: "Default",
+    10: "Corporate",
+    11: "Corporate",
+    12: "Corporate",
+    13: "Corporate",
+    20: "Corporate",
+    21: "Corporate",
+    30: "Guest",
+    31: "Guest",
+    40: "Voice",
+    41: "Voice",
+    50: "Servers",
+    60: "IoT",
+    70: "Management",
+    80: "Wireless",
+    90: "Security",
+    99: "Management",
+    100: "Data",
+}
+
+
+def _vlan_name_for(vid: int) -> str:
+    """Descriptive name for a VLAN ID, by exact match then by range."""
+    if vid in _NAMED_VLANS:
+        return _NAMED_VLANS[vid]
+    elif vid < 20:
+        return "Corporate"
+    elif vid < 40:
+        return "Guest"
+    elif vid < 60:
+        return "Voice"
+    elif vid < 80:
+        return "IoT"
+    elif vid < 100:
+        return "Management"
+    else:
+        return "Data"
+
+
+# VLAN name for every valid 802.1Q ID (0-4094), resolved once at import
+_VLAN_NAMES = [_vlan_name_for(vid) for vid in range(4095)]
+
+
+@lru_cache(maxsize=1024)
+def _subnet_ip_base(subnet: str) -> str:
+    """First three octets of a CIDR subnet (e.g., '192.168.100.0/24' -> '192.168.100')."""
+    return subnet.split('/', 1)[0].rsplit('.', 1)[0]
+
+
+@lru_cache(maxsize=None)
+def _format_device_type(fmt: str, os: str) -> str:
+    """Render a deviceTypePrediction once per (format, OS) so clients share the string."""
+    return sys.intern(fmt % os if "%s" in fmt else fmt)
+
+
+@lru_cache(maxsize=4096)
+def _vlan_id_str(vlan_id) -> str:
+    """String form of a VLAN ID, shared across all clients on that VLAN."""
+    return sys.intern(str(vlan_id))
+
+
+# Switch access ports clients can be attached to (GigabitEthernet1/0/1-48)
+_SWITCHPORTS = tuple(sys.intern(f"GigabitEthernet1/0/{port}") for port in range(1, 49))
+
+# Every "first.last" username, built once so clients share the same string objects
+_FIRST_NAMES = ("john", "jane", "mike", "sarah", "david", "lisa", "tom", "anna", "chris", "kate")
+_LAST_NAMES = ("smith", "jones", "wilson", "brown", "davis", "miller", "moore", "taylor", "anderson", "thomas")
+_USERNAMES = tuple(tuple(sys.intern(f"{first}.{last}") for last in _LAST_NAMES) for first in _FIRST_NAMES)
+
+# Two-digit lowercase hex for each byte value, used to format MAC suffixes
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+# (is IoT device, on a Guest VLAN) -> (SSID, fallback for the 10% Corporate miss)
+_SSID_TABLE = {
+    (True, True): ("IoT", "IoT"),
+    (True, False): ("IoT", "IoT"),
+    (False, True): ("Guest", "Guest"),
+    (False, False): ("Corporate", "Guest"),
+}
+
+
+@lru_cache(maxsize=256)
+def _is_guest_vlan(named_vlan: Optional[str]) -> bool:
+    """Whether a VLAN name marks a guest VLAN (case-insensitive)."""
+    return bool(named_vlan) and "guest" in named_vlan.lower()
+
+
+def _pick_ssid(iot: bool, named_vlan: Optional[str]) -> str:
+    """SSID for a wireless client from its IoT flag and VLAN name via _SSID_TABLE."""
+    ssid, fallback = _SSID_TABLE[(iot, _is_guest_vlan(named_vlan))]
+    # Corporate users - mostly Corporate SSID, some Guest
+    return ssid if ssid != "Corporate" or random.random() < 0.9 else fallback
+
+
+# Range of numeric client IDs (formatted as "k123456")
+CLIENT_ID_RANGE = range(100000, 1000000)
+
+# Character set for random hostname suffixes, and every two-character pair of it
+_ALPHANUM = string.ascii_uppercase + string.digits
+_ALPHANUM_PAIRS = tuple(a + b for a in _ALPHANUM for b in _ALPHANUM)
+_SUFFIX_SPACE = len(_ALPHANUM_PAIRS) ** 2
 
 # Common hostnames/descriptions
 HOSTNAME_PREFIXES = [
@@ -113,6 +469,84 @@ HOSTNAME_PREFIXES = [
 ]
 
 
+# Optional client attributes; repeated None entries weight "not set" as in the Meraki data
+_NOTES = (None, None, None, "Visitor device", "Temp access", "Executive laptop", "Conference room")
+_ADAPTIVE_POLICY_GROUPS = (None, None, "1: Employee", "2: Infrastructure", "3: Guest", "4: IoT Devices")
+_GROUP_POLICIES_8021X = (None, None, None, "Employee_Access", "Guest_Access", "Contractor_Access", "Student_Access")
+_PSK_GROUPS = (None, None, None, "Group 1", "Group 2", "IoT Group")
+
+# Radio capabilities are equally likely, so a plain uniform index suffices
+_WIRELESS_CAPABILITIES = (
+    "802.11ac - 2.4 GHz",
+    "802.11ac - 5 GHz",
+    "802.11ax - 2.4 GHz",
+    "802.11ax - 5 GHz",
+    "802.11ax - 6 GHz",
+    "802.11n - 2.4 GHz",
+)
+
+
+@dataclass(slots=True)
+class Client:
+    """
+    Base client record shared by the network and device client views.
+
+    Field names match the Meraki API keys so to_dict() is a straight copy.
+    """
+    id: str
+    mac: str
+    ip: str
+    ip6: Optional[str]
+    ip6Local: Optional[str]
+    description: str
+    firstSeen: str
+    lastSeen: str
+    manufacturer: str
+    os: str
+    deviceTypePrediction: str
+    user: Optional[str]
+    vlan: str
+    namedVlan: str
+    ssid: Optional[str]
+    switchport: Optional[str]
+    wirelessCapabilities: Optional[str]
+    smInstalled: bool
+    recentDeviceSerial: Optional[str]
+    recentDeviceName: Optional[str]
+    recentDeviceMac: Optional[str]
+    recentDeviceConnection: str
+    notes: Optional[str]
+    groupPolicy8021x: Optional[str]
+    adaptivePolicyGroup: Optional[str]
+    pskGroup: Optional[str]
+    status: str
+    usage: dict
+
+    def to_dict(self) -> dict:
+        """Return the full client as a Meraki API dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_device_dict(self) -> dict:
+        """Return the simplified /devices/{serial}/clients view of this client."""
+        return {
+            "id": self.id,
+            "mac": self.mac,
+            "description": self.description,
+            "mdnsName": self.description,  # Often same as description
+            "dhcpHostname": self.description.replace("-", "").upper()[:15],
+            "user": self.user,
+            "ip": self.ip,
+            "vlan": self.vlan,
+            "namedVlan": self.namedVlan,
+            "switchport": self.switchport,
+            "adaptivePolicyGroup": self.adaptivePolicyGroup,
+            "usage": {
+                "sent": self.usage["sent"] // 1000,  # Convert to KB (integer) for device endpoint
+                "recv": self.usage["recv"] // 1000
+            }
+        }
+
+
 class ClientGenerator:
     """Generator for realistic network client data."""
 
@@ -121,19 +555,33 @@ class ClientGenerator:
         if seed is not None:
             random.seed(seed)
 
-        # Build weighted lists for random selection
-        self._manufacturers = []
-        for m in CLIENT_MANUFACTURERS:
-            self._manufacturers.extend([m] * m["weight"])
+        # Cumulative weights so random.choices() can draw whole batches with bisect
+        self._mfr_cum = list(accumulate(m["weight"] for m in CLIENT_MANUFACTURERS))
+        self._oui_lc_by_oui = {m["oui"]: m["oui"].lower() for m in CLIENT_MANUFACTURERS}
+        # Keyed by OUI since manufacturer names repeat (Apple, HP, Samsung)
+        self._os_by_oui = {m["oui"]: tuple(m["os"]) for m in CLIENT_MANUFACTURERS}
 
-        self._device_types = []
-        for d in DEVICE_TYPES:
-            self._device_types.extend([d] * d["weight"])
+        # Usage table row and IoT flag per (OUI, hostname type, OS) - a small closed set, resolved once
+        self._type_info = {}
+        for m in CLIENT_MANUFACTURERS:
+            choices = _PREFIXES_BY_OUI.get(m["oui"], _DEFAULT_PREFIXES)
+            for type_idx, (prefix, fmt) in enumerate(choices):
+                for os_name in m["os"]:
+                    device_type = _format_device_type(fmt, os_name)
+                    self._type_info[(m["oui"], type_idx, os_name)] = (
+                        _usage_index_for(device_type),
+                        _iot_classify(f"{prefix}-", device_type),
+                    )
+
+    def _pick_manufacturers(self, n: int) -> list[dict]:
+        """Draw n manufacturers according to their weights."""
+        return random.choices(CLIENT_MANUFACTURERS, cum_weights=self._mfr_cum, k=n)
 
     def _generate_mac(self, oui: str) -> str:
         """Generate a MAC address with the given OUI (lowercase like real Meraki API)."""
-        suffix = ':'.join(f'{random.randint(0, 255):02x}' for _ in range(3))
-        return f"{oui.lower()}:{suffix}"
+        oui_lc = self._oui_lc_by_oui.get(oui) or oui.lower()
+        v = random.getrandbits(24)
+        return f"{oui_lc}:{_HEX[(v >> 16) & 0xff]}:{_HEX[(v >> 8) & 0xff]}:{_HEX[v & 0xff]}"
 
     def _generate_ip_from_subnet(self, subnet: str, client_index: int) -> str:
         """Generate a client IP address from the VLAN's actual subnet.
@@ -145,136 +593,29 @@ class ClientGenerator:
         Returns:
             IP address within the subnet (e.g., '192.168.100.5')
         """
-        # Parse subnet to get base (e.g., '192.168.100.0/24' -> '192.168.100')
-        base = subnet.split('/')[0].rsplit('.', 1)[0]
+        base = _subnet_ip_base(subnet)
         fourth = (client_index % 250) + 2  # Start from .2, leave .1 for gateway
         return f"{base}.{fourth}"
 
-    def _generate_hostname_and_type(self, oui: str, os: str) -> tuple[str, str]:
+    def _generate_hostname_and_type(self, oui: str, os: str) -> tuple[str, str, int]:
         """Generate a realistic hostname and Meraki-style deviceTypePrediction.
 
         Args:
-            oui: The OUI prefix (e.g., '3C:E0:72') used to determine device type
+            oui: The uppercase OUI prefix (e.g., '3C:E0:72') used to determine device type
             os: The operating system string
 
         Returns:
-            Tuple of (hostname, deviceTypePrediction)
+            Tuple of (hostname, deviceTypePrediction, index of the chosen hostname type)
         """
-        # Map OUI to hostname prefixes with Meraki-style device type predictions
-        # Meraki returns detailed strings like "iPhone SE, iOS9.3.5"
-        # Using OUI allows us to distinguish device types even with same manufacturer name
-        prefixes_by_oui = {
-            # Apple Mobile (iPhone/iPad) - OUI: 3C:E0:72
-            "3C:E0:72": [
-                ("IPHONE", lambda o: f"iPhone, {o}"),
-                ("IPAD", lambda o: f"iPad, {o}"),
-            ],
-            # Apple Mac (MacBook/iMac) - OUI: A4:83:E7
-            "A4:83:E7": [
-                ("MACBOOK", lambda o: f"MacBook Pro, {o}"),
-                ("IMAC", lambda o: f"iMac, {o}"),
-            ],
-            # Samsung Mobile (phones/tablets) - OUI: 84:25:DB
-            "84:25:DB": [
-                ("GALAXY", lambda o: f"Samsung Galaxy, {o}"),
-                ("SAMSUNG-TAB", lambda o: f"Samsung Tablet, {o}"),
-            ],
-            # Samsung TV - OUI: 8C:79:F5
-            "8C:79:F5": [
-                ("SAMSUNG-TV", lambda o: f"Samsung Smart TV, {o}"),
-                ("SMARTTV", lambda o: f"Samsung Smart TV, {o}"),
-            ],
-            # Dell - OUI: F8:B1:56
-            "F8:B1:56": [
-                ("DELL-LAPTOP", lambda o: f"Dell Laptop, {o}"),
-                ("DELL-DESKTOP", lambda o: f"Dell Desktop, {o}"),
-            ],
-            # HP Laptop - OUI: 10:B6:76
-            "10:B6:76": [
-                ("HP-LAPTOP", lambda o: f"HP Laptop, {o}"),
-                ("HP-DESKTOP", lambda o: f"HP Desktop, {o}"),
-            ],
-            # HP Printer - OUI: C8:B5:AD
-            "C8:B5:AD": [
-                ("HP-PRINTER", lambda o: "HP LaserJet Printer"),
-                ("HP-MFP", lambda o: "HP OfficeJet MFP"),
-            ],
-            # Lenovo - OUI: 28:D2:44
-            "28:D2:44": [
-                ("LENOVO", lambda o: f"Lenovo ThinkPad, {o}"),
-                ("THINKPAD", lambda o: f"Lenovo ThinkPad, {o}"),
-            ],
-            # Microsoft Surface - OUI: 28:18:78
-            "28:18:78": [
-                ("SURFACE", lambda o: f"Microsoft Surface, {o}"),
-                ("DEVICE", lambda o: f"Windows PC, {o}"),
-            ],
-            # Intel NUC - OUI: A4:34:D9
-            "A4:34:D9": [
-                ("DEVICE", lambda o: f"Intel NUC, {o}"),
-            ],
-            # Google Pixel/Chromebook - OUI: F4:F5:D8
-            "F4:F5:D8": [
-                ("PIXEL", lambda o: f"Google Pixel, {o}"),
-                ("CHROMEBOOK", lambda o: f"Chromebook, {o}"),
-            ],
-            # Epson Printer - OUI: 00:26:AB
-            "00:26:AB": [
-                ("EPSON-PRINTER", lambda o: "Epson Printer"),
-            ],
-            # Canon Printer - OUI: 00:1E:8F
-            "00:1E:8F": [
-                ("CANON-PRINTER", lambda o: "Canon Printer"),
-            ],
-            # LG TV - OUI: A8:23:FE
-            "A8:23:FE": [
-                ("LG-TV", lambda o: f"LG Smart TV, {o}"),
-                ("LGTV", lambda o: f"LG Smart TV, {o}"),
-            ],
-            # Cisco VoIP - OUI: 00:1B:0D
-            "00:1B:0D": [
-                ("VOIP", lambda o: "Cisco IP Phone"),
-                ("CISCO-PHONE", lambda o: "Cisco IP Phone 8845"),
-            ],
-            # Zebra Scanner - OUI: 00:A0:F8
-            "00:A0:F8": [
-                ("ZEBRA-SCANNER", lambda o: "Zebra Scanner"),
-                ("SCANNER", lambda o: "Zebra TC52"),
-            ],
-            # Honeywell Scanner - OUI: 00:40:84
-            "00:40:84": [
-                ("HON-SCANNER", lambda o: "Honeywell Scanner"),
-                ("SCANNER", lambda o: "Honeywell CT60"),
-            ],
-            # Axis IP Camera - OUI: 00:40:8C
-            "00:40:8C": [
-                ("AXIS-CAM", lambda o: "Axis IP Camera"),
-                ("CAMERA", lambda o: "Axis P3245-V"),
-            ],
-            # Texas Instruments IoT Sensor - OUI: 00:17:E5
-            "00:17:E5": [
-                ("SENSOR", lambda o: "IoT Sensor"),
-                ("TI-SENSOR", lambda o: "Environmental Sensor"),
-            ],
-            # GE Healthcare - OUI: 00:00:9A
-            "00:00:9A": [
-                ("GE-MEDICAL", lambda o: "GE Patient Monitor"),
-                ("GE-MONITOR", lambda o: "GE CARESCAPE Monitor"),
-            ],
-            # Philips Healthcare - OUI: 00:1E:C0
-            "00:1E:C0": [
-                ("PHILIPS-MED", lambda o: "Philips IntelliVue"),
-                ("PATIENT-MON", lambda o: "Philips Patient Monitor"),
-            ],
-        }
-
-        # Normalize OUI to uppercase for lookup
-        oui_upper = oui.upper()
-        choices = prefixes_by_oui.get(oui_upper, [("DEVICE", lambda o: f"Unknown Device, {o}")])
-        prefix, type_func = random.choice(choices)
-        device_type = type_func(os)
-        suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
-        return f"{prefix}-{suffix}", device_type
+        # OUIs in CLIENT_MANUFACTURERS and _PREFIXES_BY_OUI are both uppercase
+        choices = _PREFIXES_BY_OUI.get(oui, _DEFAULT_PREFIXES)
+        type_idx = random.randrange(len(choices))
+        prefix, fmt = choices[type_idx]
+        device_type = _format_device_type(fmt, os)
+        # One draw covers all four characters: high and low halves each pick a pair
+        hi, lo = divmod(random.randrange(_SUFFIX_SPACE), len(_ALPHANUM_PAIRS))
+        suffix = _ALPHANUM_PAIRS[hi] + _ALPHANUM_PAIRS[lo]
+        return f"{prefix}-{suffix}", device_type, type_idx
 
     def _is_iot_device(self, hostname: str, device_type_prediction: str) -> bool:
         """Determine if a device is an IoT device based on hostname and type prediction.
@@ -282,55 +623,12 @@ class ClientGenerator:
         IoT devices: printers, scanners, sensors, cameras, VoIP phones, Smart TVs, medical
         Non-IoT: laptops, desktops, phones, tablets (user devices)
         """
-        hostname_upper = hostname.upper()
-        type_lower = device_type_prediction.lower() if device_type_prediction else ""
-
-        # IoT device patterns
-        iot_patterns = [
-            "PRINTER", "SCANNER", "SENSOR", "CAMERA", "VOIP",
-            "NUC", "DEVICE-", "SMARTTV", "TV", "GE-", "PHILIPS-",
-            "PATIENT", "MEDICAL", "MONITOR"
-        ]
-        iot_type_patterns = [
-            "printer", "scanner", "sensor", "camera", "ip phone",
-            "iot", "intel nuc", "smart tv", "television", "medical",
-            "patient", "healthcare"
-        ]
-
-        # Check hostname
-        for pattern in iot_patterns:
-            if pattern in hostname_upper:
-                return True
-
-        # Check device type prediction
-        for pattern in iot_type_patterns:
-            if pattern in type_lower:
-                return True
-
-        return False
-
-    def _get_ssid_for_device(self, hostname: str, device_type_prediction: str, named_vlan: str) -> str:
-        """Determine appropriate SSID based on device type.
-
-        - IoT devices (printers, sensors, cameras) → "IoT"
-        - User devices on Guest VLAN → "Guest"
-        - User devices on Corporate/other VLANs → "Corporate" (90%) or "Guest" (10%)
-        """
-        if self._is_iot_device(hostname, device_type_prediction):
-            return "IoT"
-
-        # User devices - check VLAN for Guest
-        if named_vlan and "guest" in named_vlan.lower():
-            return "Guest"
-
-        # Corporate users - mostly Corporate SSID, some Guest
-        return "Corporate" if random.random() < 0.9 else "Guest"
+        return _iot_classify(_hostname_prefix(hostname).upper(), device_type_prediction or "")
 
     def _generate_user(self) -> str:
         """Generate a realistic username."""
-        first_names = ["john", "jane", "mike", "sarah", "david", "lisa", "tom", "anna", "chris", "kate"]
-        last_names = ["smith", "jones", "wilson", "brown", "davis", "miller", "moore", "taylor", "anderson", "thomas"]
-        return f"{random.choice(first_names)}.{random.choice(last_names)}"
+        first = random.randrange(len(_FIRST_NAMES))
+        return _USERNAMES[first][random.randrange(len(_LAST_NAMES))]
 
     def _get_vlan_name(self, vlan_id) -> str:
         """Get descriptive VLAN name based on ID."""
@@ -338,44 +636,11 @@ class ClientGenerator:
         try:
             vid = int(vlan_id)
         except (ValueError, TypeError):
-            return f"VLAN {vlan_id}"
-
-        # Map common VLAN IDs to descriptive names
-        vlan_names = {
-            1: "Default",
-            10: "Corporate",
-            11: "Corporate",
-            12: "Corporate",
-            13: "Corporate",
-            20: "Corporate",
-            21: "Corporate",
-            30: "Guest",
-            31: "Guest",
-            40: "Voice",
-            41: "Voice",
-            50: "Servers",
-            60: "IoT",
-            70: "Management",
-            80: "Wireless",
-            90: "Security",
-            99: "Management",
-            100: "Data",
-        }
-        # For unmapped VLANs, generate descriptive name based on range
-        if vid in vlan_names:
-            return vlan_names[vid]
-        elif vid < 20:
-            return "Corporate"
-        elif vid < 40:
-            return "Guest"
-        elif vid < 60:
-            return "Voice"
-        elif vid < 80:
-            return "IoT"
-        elif vid < 100:
-            return "Management"
-        else:
-            return "Data"
+            return sys.intern(f"VLAN {vlan_id}")
+
+        if 0 <= vid < len(_VLAN_NAMES):
+            return _VLAN_NAMES[vid]
+        return _vlan_name_for(vid)
 
     def generate_client(
         self,
@@ -385,8 +650,10 @@ class ClientGenerator:
         client_index: int,
         device_serial: Optional[str] = None,
         vlan_subnet: Optional[str] = None,
-        force_manufacturer: Optional[dict] = None
-    ) -> dict:
+        force_manufacturer: Optional[dict] = None,
+        now_ts: Optional[int] = None,
+        assign_connection: bool = True
+    ) -> Client:
         """
         Generate a single client with realistic attributes.
 
@@ -398,101 +665,133 @@ class ClientGenerator:
             device_serial: Optional device serial the client is connected to
             vlan_subnet: VLAN subnet in CIDR (e.g., '192.168.100.0/24') for correct IP
             force_manufacturer: Optional manufacturer dict to force specific device type
+            now_ts: Reference Unix time for firstSeen/lastSeen (defaults to now)
+            assign_connection: Draw the connection type, switchport, SSID and radio here.
+                               Pass False when the caller attaches clients to devices itself;
+                               those fields are then left as None
 
         Returns:
-            Client data dictionary
+            Client record; use to_dict() for the full API dictionary
+        """
+        client, _ = self._generate_core(
+            client_id, network_id, vlan_id, client_index, device_serial,
+            vlan_subnet, force_manufacturer, now_ts, assign_connection
+        )
+        return client
+
+    def _generate_core(
+        self,
+        client_id: str,
+        network_id: str,
+        vlan_id: int,
+        client_index: int,
+        device_serial: Optional[str],
+        vlan_subnet: Optional[str],
+        force_manufacturer: Optional[dict],
+        now_ts: Optional[int],
+        assign_connection: bool
+    ) -> tuple[Client, bool]:
+        """
+        Body of generate_client().
+
+        Also returns whether the client is an IoT device, so callers that attach
+        connections later can pick an SSID without reclassifying the hostname.
         """
-        manufacturer = force_manufacturer if force_manufacturer else random.choice(self._manufacturers)
+        if force_manufacturer:
+            manufacturer = force_manufacturer
+        else:
+            manufacturer = self._pick_manufacturers(1)[0]
 
-        mac = self._generate_mac(manufacturer["oui"])
+        oui = manufacturer["oui"]
+        mac = self._generate_mac(oui)
         # Use actual VLAN subnet if provided, otherwise fall back to VLAN ID
         if vlan_subnet:
             ip = self._generate_ip_from_subnet(vlan_subnet, client_index)
         else:
             # Fallback for backwards compatibility
             ip = f"192.168.{vlan_id}.{(client_index % 250) + 2}"
-        os = random.choice(manufacturer["os"])
-        hostname, device_type_prediction = self._generate_hostname_and_type(manufacturer["oui"], os)
+        os_choices = self._os_by_oui.get(oui) or tuple(manufacturer["os"])
+        os = os_choices[random.randrange(len(os_choices))]
+        hostname, device_type_prediction, type_idx = self._generate_hostname_and_type(oui, os)
 
         # Calculate realistic timestamps (Unix timestamps as integers per Meraki API)
-        now = datetime.utcnow()
-        first_seen = now - timedelta(days=random.randint(1, 90))
-        last_seen = now - timedelta(minutes=random.randint(0, 60))
-        first_seen_ts = str(int(first_seen.timestamp()))
-        last_seen_ts = str(int(last_seen.timestamp()))
+        if now_ts is None:
+            now_ts = int(time.time())
+        first_seen_ts = str(now_ts - random.randint(86400, 86400 * 90))
+        last_seen_ts = str(now_ts - random.randint(0, 3600))
 
         # Get usage pattern based on device type
-        usage_patterns = {
-            "Computer": {"sent_range": (500_000_000, 5_000_000_000), "recv_range": (1_000_000_000, 10_000_000_000)},
-            "Phone": {"sent_range": (50_000_000, 500_000_000), "recv_range": (200_000_000, 2_000_000_000)},
-            "Tablet": {"sent_range": (100_000_000, 1_000_000_000), "recv_range": (500_000_000, 5_000_000_000)},
-            "Printer": {"sent_range": (1_000_000, 50_000_000), "recv_range": (10_000_000, 100_000_000)},
-            "VoIP phone": {"sent_range": (500_000_000, 2_000_000_000), "recv_range": (500_000_000, 2_000_000_000)},
-            "IP camera": {"sent_range": (5_000_000_000, 50_000_000_000), "recv_range": (10_000_000, 100_000_000)},
-            "Smart TV": {"sent_range": (100_000_000, 500_000_000), "recv_range": (2_000_000_000, 20_000_000_000)},  # High download for streaming
-            "Medical": {"sent_range": (10_000_000, 100_000_000), "recv_range": (50_000_000, 500_000_000)},  # Moderate, critical traffic
-            "Other": {"sent_range": (1_000_000, 100_000_000), "recv_range": (5_000_000, 200_000_000)},
-        }
-        # Match device type to usage pattern
-        device_type_lower = device_type_prediction.lower() if device_type_prediction else ""
-        if any(p in device_type_lower for p in ["smart tv", "television", "tizen", "webos"]):
-            pattern = usage_patterns["Smart TV"]
-        elif any(p in device_type_lower for p in ["medical", "patient", "healthcare", "intellivue", "carescape"]):
-            pattern = usage_patterns["Medical"]
+        type_info = self._type_info.get((oui, type_idx, os))
+        if type_info is None:
+            type_info = (
+                _usage_index_for(device_type_prediction),
+                self._is_iot_device(hostname, device_type_prediction),
+            )
+        usage_idx, iot = type_info
+        sent_lo, sent_hi, recv_lo, recv_hi = _USAGE_TABLE[usage_idx]
+        sent = random.randint(sent_lo, sent_hi)
+        recv = random.randint(recv_lo, recv_hi)
+
+        named_vlan = self._get_vlan_name(vlan_id)
+
+        # Decide the connection first so wired clients never draw wireless fields
+        if not assign_connection:
+            connection = switchport = ssid = wireless_capabilities = None
+        elif random.random() <= 0.4:
+            connection = "Wireless"
+            switchport = None
+            ssid = _pick_ssid(iot, named_vlan)
+            wireless_capabilities = _WIRELESS_CAPABILITIES[random.randrange(len(_WIRELESS_CAPABILITIES))]
         else:
-            pattern = usage_patterns.get(device_type_prediction, usage_patterns["Other"])
-        sent = random.randint(*pattern["sent_range"])
-        recv = random.randint(*pattern["recv_range"])
-
-        client = {
-            "id": client_id,
-            "mac": mac,
-            "ip": ip,
-            "ip6": None,
-            "ip6Local": None,
-            "description": hostname,
-            "firstSeen": first_seen_ts,
-            "lastSeen": last_seen_ts,
-            "manufacturer": manufacturer["name"],
-            "os": os,
-            "deviceTypePrediction": device_type_prediction,
-            "user": self._generate_user() if random.random() > 0.3 else None,
-            "vlan": str(vlan_id),
-            "namedVlan": self._get_vlan_name(vlan_id),
-            "switchport": f"GigabitEthernet1/0/{random.randint(1, 48)}" if random.random() > 0.4 else None,
-            "ssid": None,  # Will be set for wireless clients
-            "status": "Online" if random.random() > 0.1 else "Offline",
-            "notes": random.choice([None, None, None, "Visitor device", "Temp access", "Executive laptop", "Conference room"]),
-            "smInstalled": random.random() > 0.8,
-            "recentDeviceSerial": device_serial,
-            "recentDeviceName": None,
-            "recentDeviceMac": None,
-            "recentDeviceConnection": "Wired" if random.random() > 0.4 else "Wireless",
-            "wirelessCapabilities": None,
-            "adaptivePolicyGroup": random.choice([None, None, "1: Employee", "2: Infrastructure", "3: Guest", "4: IoT Devices"]),
-            "groupPolicy8021x": random.choice([None, None, None, "Employee_Access", "Guest_Access", "Contractor_Access", "Student_Access"]),
-            "pskGroup": random.choice([None, None, None, "Group 1", "Group 2", "IoT Group"]),
-            "usage": {
+            connection = "Wired"
+            switchport = _SWITCHPORTS[random.randrange(len(_SWITCHPORTS))] if random.random() > 0.4 else None
+            ssid = None
+            wireless_capabilities = None
+
+        # Same seed gives the same clients within a generator version; changing draw order changes output
+        user = self._generate_user() if random.random() > 0.3 else None
+        status = "Online" if random.random() > 0.1 else "Offline"
+        notes = random.choice(_NOTES)
+        sm_installed = random.random() > 0.8
+        adaptive_policy_group = random.choice(_ADAPTIVE_POLICY_GROUPS)
+        group_policy = random.choice(_GROUP_POLICIES_8021X)
+        psk_group = random.choice(_PSK_GROUPS)
+        client = Client(
+            id=client_id,
+            mac=mac,
+            ip=ip,
+            ip6=None,
+            ip6Local=None,
+            description=hostname,
+            firstSeen=first_seen_ts,
+            lastSeen=last_seen_ts,
+            manufacturer=manufacturer["name"],
+            os=os,
+            deviceTypePrediction=device_type_prediction,
+            user=user,
+            vlan=_vlan_id_str(vlan_id),
+            namedVlan=named_vlan,
+            ssid=ssid,
+            switchport=switchport,
+            wirelessCapabilities=wireless_capabilities,
+            smInstalled=sm_installed,
+            recentDeviceSerial=device_serial,
+            recentDeviceName=None,
+            recentDeviceMac=None,
+            recentDeviceConnection=connection,
+            notes=notes,
+            groupPolicy8021x=group_policy,
+            adaptivePolicyGroup=adaptive_policy_group,
+            pskGroup=psk_group,
+            status=status,
+            usage={
                 "sent": sent,
                 "recv": recv,
                 "total": sent + recv
             }
-        }
+        )
 
-        # Add wireless-specific fields
-        if client["recentDeviceConnection"] == "Wireless":
-            client["ssid"] = random.choice(["Corporate", "Guest", "IoT"])
-            client["switchport"] = None
-            client["wirelessCapabilities"] = random.choice([
-                "802.11ac - 2.4 GHz",
-                "802.11ac - 5 GHz",
-                "802.11ax - 2.4 GHz",
-                "802.11ax - 5 GHz",
-                "802.11ax - 6 GHz",
-                "802.11n - 2.4 GHz"
-            ])
-
-        return client
+        return client, iot
 
     def generate_network_client(
         self,
@@ -501,7 +800,8 @@ class ClientGenerator:
         vlan_id: int,
         client_index: int,
         vlan_subnet: Optional[str] = None,
-        force_manufacturer: Optional[dict] = None
+        force_manufacturer: Optional[dict] = None,
+        now_ts: Optional[int] = None
     ) -> dict:
         """
         Generate a network-level client (for /networks/{id}/clients endpoint).
@@ -515,45 +815,21 @@ class ClientGenerator:
             client_index: Index for IP addressing
             vlan_subnet: VLAN subnet in CIDR for correct IP assignment
             force_manufacturer: Optional manufacturer dict to force specific device type
+            now_ts: Reference Unix time for firstSeen/lastSeen (defaults to now)
 
         Returns:
             Network client data dictionary matching Meraki API format
         """
-        base_client = self.generate_client(client_id, network_id, vlan_id, client_index, vlan_subnet=vlan_subnet, force_manufacturer=force_manufacturer)
+        base_client = self.generate_client(client_id, network_id, vlan_id, client_index, vlan_subnet=vlan_subnet, force_manufacturer=force_manufacturer, now_ts=now_ts)
 
-        # Network clients include ALL fields per Meraki API
-        return {
-            "id": base_client["id"],
-            "mac": base_client["mac"],
-            "ip": base_client["ip"],
-            "ip6": base_client["ip6"],
-            "ip6Local": base_client["ip6Local"],
-            "description": base_client["description"],
-            "firstSeen": base_client["firstSeen"],
-            "lastSeen": base_client["lastSeen"],
-            "manufacturer": base_client["manufacturer"],
-            "os": base_client["os"],
-            "deviceTypePrediction": base_client["deviceTypePrediction"],
-            "user": base_client["user"],
-            "vlan": base_client["vlan"],
-            "namedVlan": base_client["namedVlan"],
-            "ssid": base_client["ssid"],
-            "switchport": base_client["switchport"],
-            "wirelessCapabilities": base_client["wirelessCapabilities"],
-            "smInstalled": base_client["smInstalled"],
-            "recentDeviceSerial": base_client["recentDeviceSerial"],
-            "recentDeviceName": base_client["recentDeviceName"],
-            "recentDeviceMac": base_client["recentDeviceMac"],
-            "recentDeviceConnection": base_client["recentDeviceConnection"],
-            "notes": base_client["notes"],
-            "groupPolicy8021x": base_client["groupPolicy8021x"],
-            "adaptivePolicyGroup": base_client["adaptivePolicyGroup"],
-            "pskGroup": base_client["pskGroup"],
-            "status": base_client["status"],
-            "usage": base_client["usage"],
-            # Internal field for seeding - not part of Meraki API response
-            "_network_id": network_id
-        }
+        return self._network_view(base_client, network_id)
+
+    def _network_view(self, client: Client, network_id: str) -> dict:
+        """Network clients include ALL fields per Meraki API."""
+        view = client.to_dict()
+        # Internal field for seeding - not part of Meraki API response
+        view["_network_id"] = network_id
+        return view
 
     def generate_device_client(
         self,
@@ -562,7 +838,8 @@ class ClientGenerator:
         vlan_id: int,
         client_index: int,
         device_serial: str,
-        vlan_subnet: Optional[str] = None
+        vlan_subnet: Optional[str] = None,
+        now_ts: Optional[int] = None
     ) -> dict:
         """
         Generate a device-level client (for /devices/{serial}/clients endpoint).
@@ -577,30 +854,15 @@ class ClientGenerator:
             client_index: Index for IP addressing
             device_serial: Device serial this client is connected to
             vlan_subnet: VLAN subnet in CIDR for correct IP assignment
+            now_ts: Reference Unix time for firstSeen/lastSeen (defaults to now)
 
         Returns:
             Device client data dictionary matching Meraki API format
         """
-        base_client = self.generate_client(client_id, network_id, vlan_id, client_index, device_serial, vlan_subnet=vlan_subnet)
+        base_client = self.generate_client(client_id, network_id, vlan_id, client_index, device_serial, vlan_subnet=vlan_subnet, now_ts=now_ts)
 
         # Device clients have SIMPLER structure per Meraki API docs
-        return {
-            "id": base_client["id"],
-            "mac": base_client["mac"],
-            "description": base_client["description"],
-            "mdnsName": base_client["description"],  # Often same as description
-            "dhcpHostname": base_client["description"].replace("-", "").upper()[:15],
-            "user": base_client["user"],
-            "ip": base_client["ip"],
-            "vlan": base_client["vlan"],
-            "namedVlan": base_client["namedVlan"],
-            "switchport": base_client["switchport"],
-            "adaptivePolicyGroup": base_client["adaptivePolicyGroup"],
-            "usage": {
-                "sent": int(base_client["usage"]["sent"] / 1000),  # Convert to KB (integer) for device endpoint
-                "recv": int(base_client["usage"]["recv"] / 1000)
-            }
-        }
+        return base_client.to_device_dict()
 
     def generate_clients_for_network(
         self,
@@ -629,15 +891,23 @@ class ClientGenerator:
             - network_clients: List of clients for /networks/{id}/clients
             - device_clients_map: Dict mapping device serial to list of clients
         """
-        network_clients = []
-        device_clients = {d["serial"]: [] for d in devices if d["productType"] in ["switch", "wireless"]}
-
-        # Build device lookup map for getting name and MAC
-        device_lookup = {d["serial"]: d for d in devices}
-
-        # Separate devices by type - wired clients connect to switches, wireless to APs
-        switches = [d for d in devices if d["productType"] == "switch"]
-        access_points = [d for d in devices if d["productType"] == "wireless"]
+        # Output size is known up front, so result lists are preallocated and filled by index
+        network_clients = [None] * count
+
+        # Separate devices by type in one pass - wired clients connect to switches, wireless
+        # to APs - and give every switch/AP a device client list, even if it stays empty
+        device_clients = {}
+        switches = []
+        access_points = []
+        for d in devices:
+            product_type = d["productType"]
+            if product_type == "switch":
+                switches.append(d)
+            elif product_type == "wireless":
+                access_points.append(d)
+            else:
+                continue
+            device_clients[d["serial"]] = []
 
         # Determine connection distribution based on available devices
         # If only APs exist, all clients are wireless
@@ -646,147 +916,106 @@ class ClientGenerator:
         has_switches = len(switches) > 0
         has_aps = len(access_points) > 0
 
-        # Build required manufacturers lookup using device type keys -> OUI -> manufacturer
+        # Required device type keys resolve to manufacturers via REQUIRED_KEY_TO_MFR
         required_mfrs = required_manufacturers or []
 
+        # Draw per-client VLANs and IDs for the whole batch up front,
+        # weighting VLANs so corporate/data ones get most of the clients
+        if vlans:
+            vlan_cum = list(accumulate(_vlan_weight(v) for v in vlans))
+            vlan_picks = random.choices(vlans, cum_weights=vlan_cum, k=count)
+        else:
+            vlan_picks = [{"id": 1, "name": "Default", "subnet": "192.168.1.0/24"}] * count
+        client_numbers = random.choices(CLIENT_ID_RANGE, k=count)
+        manufacturer_picks = self._pick_manufacturers(count)
+
+        # The first N clients use the required device types, if specified
+        # Device type keys (e.g., "Samsung TV", "HP Printer") map to specific manufacturers
+        for i, device_type_key in enumerate(required_mfrs[:count]):
+            manufacturer_picks[i] = REQUIRED_KEY_TO_MFR.get(device_type_key, manufacturer_picks[i])
+        now_ts = int(time.time())
+
+        # Phase 1: generate every client record
+        # (hot-loop callables are bound to locals to skip repeated attribute lookups)
+        clients = [None] * count
+        iot_flags = [False] * count
+        generate_core = self._generate_core
         for i in range(count):
-            # Pick a VLAN (weighted towards corporate/data VLANs)
-            vlan = random.choice(vlans) if vlans else {"id": 1, "name": "Default", "subnet": "192.168.1.0/24"}
+            vlan = vlan_picks[i]
             vlan_id = vlan.get("id", 1)
-            vlan_name = vlan.get("name", "Default")  # Get actual VLAN name from topology
             vlan_subnet = vlan.get("subnet")  # Get the actual subnet (e.g., '192.168.100.0/24')
 
             # Generate client ID
-            client_id = f"k{random.randint(100000, 999999)}"
-
-            # For the first N clients, use required device types if specified
-            # Device type keys (e.g., "Samsung TV", "HP Printer") map to specific OUIs
-            force_mfr = None
-            if i < len(required_mfrs):
-                device_type_key = required_mfrs[i]
-                if device_type_key in DEVICE_TYPE_BY_KEY:
-                    oui = DEVICE_TYPE_BY_KEY[device_type_key]
-                    force_mfr = MANUFACTURER_BY_OUI.get(oui)
-
-            # Generate network client first to get hostname/device type
-            net_client = self.generate_network_client(
+            client_id = f"k{client_numbers[i]}"
+
+            # Generate the client once; network and device views are built from it
+            client, iot_flags[i] = generate_core(
                 client_id=client_id,
                 network_id=network_id,
                 vlan_id=vlan_id,
                 client_index=i,
+                device_serial=None,
                 vlan_subnet=vlan_subnet,
-                force_manufacturer=force_mfr
+                force_manufacturer=manufacturer_picks[i],
+                now_ts=now_ts,
+                assign_connection=False
             )
             # Override namedVlan with actual VLAN name from topology
-            net_client["namedVlan"] = vlan_name
-
-            # Determine connection type based on DEVICE TYPE (realistic assignment)
-            hostname = net_client.get("description", "").upper()
-            device_prediction = net_client.get("deviceTypePrediction", "").lower()
-
-            # Always wireless: phones, tablets (mobile devices)
-            always_wireless = any(p in hostname for p in ["IPHONE", "IPAD", "GALAXY", "PIXEL", "SAMSUNG-TAB", "TABLET"])
-            always_wireless = always_wireless or any(p in device_prediction for p in ["iphone", "ipad", "galaxy", "pixel", "tablet", "android"])
-
-            # Always wired: desktops, printers, scanners, VoIP, sensors, cameras, NUCs, medical devices
-            always_wired = any(p in hostname for p in [
-                "DESKTOP", "PRINTER", "SCANNER", "VOIP", "SENSOR", "CAMERA", "NUC",
-                "GE-", "PHILIPS-", "PATIENT", "MEDICAL", "CISCO-PHONE", "HP-PRINTER",
-                "HP-MFP", "EPSON-", "CANON-", "AXIS-", "HON-", "ZEBRA-"
-            ])
-            always_wired = always_wired or any(p in device_prediction for p in [
-                "desktop", "printer", "scanner", "ip phone", "voip", "sensor", "camera", "nuc",
-                "medical", "patient", "healthcare", "laserjet", "officejet", "intellivue", "carescape"
-            ])
-
-            # Smart TVs: 50% wired (ethernet), 50% wireless
-            is_smart_tv = any(p in hostname for p in ["SAMSUNG-TV", "LG-TV", "SMARTTV", "LGTV"])
-            is_smart_tv = is_smart_tv or any(p in device_prediction for p in ["smart tv", "television", "tizen", "webos"])
-
-            # Determine is_wired based on device type
-            if always_wireless:
-                is_wired = False
-            elif always_wired:
-                is_wired = True
-            elif is_smart_tv:
-                # Smart TVs: 50% wired (ethernet for stable streaming), 50% wireless
-                is_wired = random.random() < 0.5
-            else:
-                # Laptops, Chromebooks, MacBooks, ThinkPads, Surfaces - mix (40% wired, 60% wireless)
-                is_wired = random.random() < 0.4
-
-            # Adjust based on available infrastructure
-            if is_wired and not has_switches:
-                is_wired = False  # Force wireless if no switches
-            if not is_wired and not has_aps:
-                is_wired = True  # Force wired if no APs
-
+            client.namedVlan = vlan.get("name", "Default")
+            clients[i] = client
+
+        # No switches or APs: every client is wired with no device to attach to
+        if not has_switches and not has_aps:
+            for i, port in enumerate(random.choices(_SWITCHPORTS, k=count)):
+                client = clients[i]
+                client.recentDeviceConnection = "Wired"
+                client.switchport = port
+                network_clients[i] = self._network_view(client, network_id)
+            return network_clients, device_clients
+
+        # Phase 2: decide wired vs wireless for the whole batch
+        is_wired = _assign_connections(clients, has_switches, has_aps)
+
+        # Phase 3: attach each client to a device and set connection-specific fields,
+        # drawing device, port and radio picks for the whole batch up front. Switches and
+        # ports go only to wired clients, APs and radio capabilities only to wireless ones
+        # Devices are drawn as prebuilt (serial, name, mac) tuples so attaching needs no dict lookups
+        wired_count = is_wired.count(True)
+        switch_info = [(d["serial"], d.get("name"), d.get("mac")) for d in switches]
+        ap_info = [(d["serial"], d.get("name"), d.get("mac")) for d in access_points]
+        switch_picks = iter(random.choices(switch_info, k=wired_count)) if has_switches else None
+        ap_picks = iter(random.choices(ap_info, k=count - wired_count)) if has_aps else None
+        port_picks = iter(random.choices(_SWITCHPORTS, k=wired_count))
+        capability_picks = iter(random.choices(_WIRELESS_CAPABILITIES, k=count - wired_count))
+
+        # Device pool and label by final connection type; is_wired only selects pools that exist
+        attach = {True: (switch_picks, "Wired"), False: (ap_picks, "Wireless")}
+
+        network_view = self._network_view
+        for i, client in enumerate(clients):
             # Pick appropriate device based on connection type
-            if is_wired and has_switches:
-                device = random.choice(switches)
-                connection_type = "Wired"
-            elif not is_wired and has_aps:
-                device = random.choice(access_points)
-                connection_type = "Wireless"
-            elif has_switches:
-                device = random.choice(switches)
-                connection_type = "Wired"
-            elif has_aps:
-                device = random.choice(access_points)
-                connection_type = "Wireless"
-            else:
-                device = None
-                connection_type = "Wired" if is_wired else "Wireless"
-
-            device_serial = device["serial"] if device else None
-            device_name = device.get("name") if device else None
-            device_mac = device.get("mac") if device else None
+            picks, connection_type = attach[is_wired[i]]
+            serial, name, mac = next(picks)
 
             # Set connection info on the already-generated client
-            net_client["recentDeviceSerial"] = device_serial
-            net_client["recentDeviceName"] = device_name
-            net_client["recentDeviceMac"] = device_mac
-            net_client["recentDeviceConnection"] = connection_type
-
-            # Use actual VLAN name for SSID determination
-            client_named_vlan = vlan_name
+            client.recentDeviceSerial = serial
+            client.recentDeviceName = name
+            client.recentDeviceMac = mac
+            client.recentDeviceConnection = connection_type
 
-            # Set connection-specific fields
+            # Set connection-specific fields; the others were left as None at generation
             if connection_type == "Wired":
                 # Wired clients have switchport, no SSID (matches real Meraki API)
-                net_client["switchport"] = f"GigabitEthernet1/0/{random.randint(1, 48)}"
-                net_client["ssid"] = None
-                net_client["wirelessCapabilities"] = None
+                client.switchport = next(port_picks)
             else:
-                # Wireless clients have SSID based on device type, no switchport
-                net_client["switchport"] = None
-                net_client["ssid"] = self._get_ssid_for_device(hostname, device_prediction, client_named_vlan)
-                net_client["wirelessCapabilities"] = random.choice([
-                    "802.11ac - 2.4 GHz",
-                    "802.11ac - 5 GHz",
-                    "802.11ax - 2.4 GHz",
-                    "802.11ax - 5 GHz",
-                    "802.11ax - 6 GHz",
-                    "802.11n - 2.4 GHz"
-                ])
-
-            network_clients.append(net_client)
-
-            # Generate device client (simpler format per Meraki API)
-            if device_serial:
-                dev_client = self.generate_device_client(
-                    client_id=client_id,
-                    network_id=network_id,
-                    vlan_id=vlan_id,
-                    client_index=i,
-                    device_serial=device_serial,
-                    vlan_subnet=vlan_subnet
-                )
-                # Ensure switchport consistency for device client too
-                if connection_type == "Wired":
-                    dev_client["switchport"] = net_client["switchport"]
-                else:
-                    dev_client["switchport"] = None
-                device_clients[device_serial].append(dev_client)
+                # Wireless clients have SSID based on device type and actual VLAN name, no switchport
+                client.ssid = _pick_ssid(iot_flags[i], client.namedVlan)
+                client.wirelessCapabilities = next(capability_picks)
+
+            network_clients[i] = network_view(client, network_id)
+
+            # Device client (simpler format per Meraki API) shares the same client,
+            # so switchport and identity stay consistent across both endpoints
+            device_clients[serial].append(client.to_device_dict())
 
         return network_clients, device_clients
@@ -45,6 +45,9 @@ ENTITY_NETWORK_CLIENT = "network_client"
 ENTITY_VPN_CONFIG = "vpn_config"
 ENTITY_CELLULAR_SUBNET_POOL = "cellular_subnet_pool"
 
+# Shared compact encoder for item payloads; generated data is acyclic plain JSON types
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
 
 def get_dynamodb_client(local: bool = False, profile: str = None, region: str = "eu-west-1"):
     """Create DynamoDB client with appropriate configuration."""
@@ -213,7 +216,7 @@ def create_item(
     item = {
         "PK": {"S": pk},
         "SK": {"S": str(entity_id)},
-        "data": {"S": json.dumps(data)},
+        "data": {"S": _JSON_ENCODER.encode(data)},
         "entity_type": {"S": entity_type},
         "topology": {"S": topology},
     }
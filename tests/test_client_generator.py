@@ -0,0 +1,316 @@
+"""
+Tests for the seed-data client generator (classification tables and record shape).
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from seed_data.generators import client_generator as cg
+from seed_data.generators.client_generator import ClientGenerator
+
+
+# (hostname prefix, deviceTypePrediction format) -> (wired odds, IoT, usage category)
+EXPECTED_BY_TYPE = {
+    ("IPHONE", "iPhone, %s"): (0.0, False, "Phone"),
+    ("IPAD", "iPad, %s"): (0.0, False, "Tablet"),
+    ("MACBOOK", "MacBook Pro, %s"): (0.4, False, "Computer"),
+    ("IMAC", "iMac, %s"): (0.4, False, "Computer"),
+    ("GALAXY", "Samsung Galaxy, %s"): (0.0, False, "Phone"),
+    ("SAMSUNG-TAB", "Samsung Tablet, %s"): (0.0, False, "Tablet"),
+    ("SAMSUNG-TV", "Samsung Smart TV, %s"): (0.5, True, "Smart TV"),
+    ("SMARTTV", "Samsung Smart TV, %s"): (0.5, True, "Smart TV"),
+    ("DELL-LAPTOP", "Dell Laptop, %s"): (0.4, False, "Computer"),
+    ("DELL-DESKTOP", "Dell Desktop, %s"): (1.0, False, "Computer"),
+    ("HP-LAPTOP", "HP Laptop, %s"): (0.4, False, "Computer"),
+    ("HP-DESKTOP", "HP Desktop, %s"): (1.0, False, "Computer"),
+    ("HP-PRINTER", "HP LaserJet Printer"): (1.0, True, "Printer"),
+    ("HP-MFP", "HP OfficeJet MFP"): (1.0, False, "Printer"),
+    ("LENOVO", "Lenovo ThinkPad, %s"): (0.4, False, "Computer"),
+    ("THINKPAD", "Lenovo ThinkPad, %s"): (0.4, False, "Computer"),
+    ("SURFACE", "Microsoft Surface, %s"): (0.4, False, "Computer"),
+    ("DEVICE", "Windows PC, %s"): (0.4, True, "Computer"),
+    ("DEVICE", "Intel NUC, %s"): (1.0, True, "Computer"),
+    ("PIXEL", "Google Pixel, %s"): (0.0, False, "Phone"),
+    ("CHROMEBOOK", "Chromebook, %s"): (0.4, False, "Computer"),
+    ("EPSON-PRINTER", "Epson Printer"): (1.0, True, "Printer"),
+    ("CANON-PRINTER", "Canon Printer"): (1.0, True, "Printer"),
+    ("LG-TV", "LG Smart TV, %s"): (0.5, True, "Smart TV"),
+    ("LGTV", "LG Smart TV, %s"): (0.5, True, "Smart TV"),
+    ("VOIP", "Cisco IP Phone"): (1.0, True, "VoIP phone"),
+    ("CISCO-PHONE", "Cisco IP Phone 8845"): (1.0, True, "VoIP phone"),
+    ("ZEBRA-SCANNER", "Zebra Scanner"): (1.0, True, "Other"),
+    ("SCANNER", "Zebra TC52"): (1.0, True, "Other"),
+    ("HON-SCANNER", "Honeywell Scanner"): (1.0, True, "Other"),
+    ("SCANNER", "Honeywell CT60"): (1.0, True, "Other"),
+    ("AXIS-CAM", "Axis IP Camera"): (1.0, True, "IP camera"),
+    ("CAMERA", "Axis P3245-V"): (1.0, True, "IP camera"),
+    ("SENSOR", "IoT Sensor"): (1.0, True, "Other"),
+    ("TI-SENSOR", "Environmental Sensor"): (1.0, True, "Other"),
+    ("GE-MEDICAL", "GE Patient Monitor"): (1.0, True, "Medical"),
+    ("GE-MONITOR", "GE CARESCAPE Monitor"): (1.0, True, "Medical"),
+    ("PHILIPS-MED", "Philips IntelliVue"): (1.0, True, "Medical"),
+    ("PATIENT-MON", "Philips Patient Monitor"): (1.0, True, "Medical"),
+}
+
+# The same prefix can be classified differently by OS: Android marks a device always wireless
+WIRED_ODDS_BY_OS = {
+    ("CHROMEBOOK", "Android 14"): 0.0,
+}
+
+NETWORK_CLIENT_KEYS = [
+    "id", "mac", "ip", "ip6", "ip6Local", "description", "firstSeen", "lastSeen",
+    "manufacturer", "os", "deviceTypePrediction", "user", "vlan", "namedVlan", "ssid",
+    "switchport", "wirelessCapabilities", "smInstalled", "recentDeviceSerial",
+    "recentDeviceName", "recentDeviceMac", "recentDeviceConnection", "notes",
+    "groupPolicy8021x", "adaptivePolicyGroup", "pskGroup", "status", "usage", "_network_id",
+]
+
+DEVICE_CLIENT_KEYS = [
+    "id", "mac", "description", "mdnsName", "dhcpHostname", "user", "ip", "vlan",
+    "namedVlan", "switchport", "adaptivePolicyGroup", "usage",
+]
+
+
+def _client_types():
+    """Every (prefix, format, OS, deviceTypePrediction) a generator can emit."""
+    for manufacturer in cg.CLIENT_MANUFACTURERS:
+        for prefix, fmt in cg._PREFIXES_BY_OUI.get(manufacturer["oui"], cg._DEFAULT_PREFIXES):
+            for os_name in manufacturer["os"]:
+                yield prefix, fmt, os_name, cg._format_device_type(fmt, os_name)
+
+
+CLIENT_TYPES = sorted(set(_client_types()))
+
+
+def _reference_wired_odds(hostname: str, device_type_prediction: str) -> float:
+    """The original per-client any() rules, kept as an oracle for the keyword regex."""
+    host = hostname.upper()
+    dtp = device_type_prediction.lower()
+    for odds, host_keywords, type_keywords in cg._CONNECTION_CLASSES:
+        if any(k in host for k in host_keywords) or any(k in dtp for k in type_keywords):
+            return odds
+    return cg._DEFAULT_WIRED_ODDS
+
+
+class TestClassificationTables:
+    """Pin wired odds, IoT class and usage category for every generated device type."""
+
+    def test_every_prefix_entry_is_pinned(self):
+        """Test the expectations cover exactly the hostname prefix table."""
+        generated = {(prefix, fmt) for prefix, fmt, _, _ in CLIENT_TYPES}
+        assert generated == set(EXPECTED_BY_TYPE)
+
+    @pytest.mark.parametrize("prefix,fmt,os_name,dtp", CLIENT_TYPES)
+    def test_wired_odds(self, prefix, fmt, os_name, dtp):
+        """Test connection odds from the hostname prefix and deviceTypePrediction."""
+        expected = WIRED_ODDS_BY_OS.get((prefix, os_name), EXPECTED_BY_TYPE[(prefix, fmt)][0])
+        assert cg._wired_odds(f"{prefix}-", dtp) == expected
+
+    @pytest.mark.parametrize("prefix,fmt,os_name,dtp", CLIENT_TYPES)
+    def test_wired_odds_match_reference_rules(self, prefix, fmt, os_name, dtp):
+        """Test the single keyword scan agrees with the ordered any() checks."""
+        assert cg._wired_odds(f"{prefix}-", dtp) == _reference_wired_odds(f"{prefix}-", dtp)
+
+    @pytest.mark.parametrize("prefix,fmt,os_name,dtp", CLIENT_TYPES)
+    def test_iot_classify(self, prefix, fmt, os_name, dtp):
+        """Test IoT classification from the hostname prefix and deviceTypePrediction."""
+        assert cg._iot_classify(f"{prefix}-", dtp) is EXPECTED_BY_TYPE[(prefix, fmt)][1]
+
+    @pytest.mark.parametrize("prefix,fmt,os_name,dtp", CLIENT_TYPES)
+    def test_usage_category(self, prefix, fmt, os_name, dtp):
+        """Test each deviceTypePrediction maps to its usage range row."""
+        category = EXPECTED_BY_TYPE[(prefix, fmt)][2]
+        assert cg._usage_index_for(dtp) == cg._USAGE_INDEX[category]
+
+    def test_usage_accepts_category_names(self):
+        """Test bare category names still resolve, and unknown types fall back to Other."""
+        assert cg._usage_index_for("Computer") == cg._USAGE_INDEX["Computer"]
+        assert cg._usage_index_for("Mystery Gadget") == cg._USAGE_INDEX["Other"]
+        assert cg._usage_index_for("") == cg._USAGE_INDEX["Other"]
+
+
+class TestAssignConnections:
+    """Tests for deciding wired vs wireless from per-prefix connection odds."""
+
+    CLIENTS = [
+        SimpleNamespace(description="IPHONE-0001", deviceTypePrediction="iPhone, iOS 17"),
+        SimpleNamespace(description="HP-PRINTER-0002", deviceTypePrediction="HP LaserJet Printer"),
+        SimpleNamespace(description="IPHONE-0003", deviceTypePrediction="iPhone, iOS 17"),
+        SimpleNamespace(description="CAMERA-0004", deviceTypePrediction="Axis P3245-V"),
+    ]
+
+    def test_fixed_odds_ignore_the_hostname_suffix(self):
+        """Test phones are always wireless and printers and cameras always wired."""
+        assert cg._assign_connections(self.CLIENTS, True, True) == [False, True, False, True]
+
+    def test_fixed_odds_draw_no_random_numbers(self):
+        """Test only mixed device types consume draws from the seeded stream."""
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        cg._assign_connections(self.CLIENTS, True, True)
+        assert random.random() == expected
+
+    def test_missing_device_class_forces_the_other(self):
+        """Test a network without APs is all wired and one without switches all wireless."""
+        assert cg._assign_connections(self.CLIENTS, True, False) == [True] * 4
+        assert cg._assign_connections(self.CLIENTS, False, True) == [False] * 4
+
+
+class TestIotClassification:
+    """Tests for classifying clients as IoT once per (hostname prefix, deviceTypePrediction)."""
+
+    @pytest.mark.parametrize("hostname,prefix", [
+        ("HP-PRINTER-4821", "HP-PRINTER-"),
+        ("IPHONE-A1B2", "IPHONE-"),
+        ("WORKSTATION", "WORKSTATION"),
+    ])
+    def test_hostname_prefix(self, hostname, prefix):
+        """Test the random suffix is dropped and the dash kept."""
+        assert cg._hostname_prefix(hostname) == prefix
+
+    def test_suffix_does_not_change_the_result(self):
+        """Test hostnames sharing a prefix classify the same as their prefix."""
+        generator = ClientGenerator(seed=1)
+        for hostname in ("HP-PRINTER-0001", "HP-PRINTER-9999", "hp-printer-42"):
+            assert generator._is_iot_device(hostname, "HP LaserJet Printer") is True
+        for hostname in ("MACBOOK-0001", "MACBOOK-ZZZZ"):
+            assert generator._is_iot_device(hostname, "MacBook Pro, macOS Sonoma") is False
+
+    def test_device_type_is_part_of_the_key(self):
+        """Test one prefix classifies by its deviceTypePrediction, not whichever was seen first."""
+        assert cg._iot_classify("LAPTOP-", "Dell Laptop, Windows 11") is False
+        assert cg._iot_classify("LAPTOP-", "IoT Sensor") is True
+        assert cg._iot_classify("LAPTOP-", "Dell Laptop, Windows 11") is False
+
+    def test_missing_device_type(self):
+        """Test a null deviceTypePrediction falls back to the hostname alone."""
+        generator = ClientGenerator(seed=1)
+        assert generator._is_iot_device("MACBOOK-0001", None) is False
+        assert generator._is_iot_device("CAMERA-0001", None) is True
+
+
+class TestUsage:
+    """Tests for drawing client bandwidth usage from the device type's range."""
+
+    def test_usage_falls_in_the_device_type_range(self):
+        """Test each client's usage comes from its category's USAGE_PATTERNS ranges."""
+        vlans = [{"id": 10, "name": "Corporate", "subnet": "192.168.10.0/24"}]
+        devices = [
+            {"serial": "Q2SW-0001", "productType": "switch"},
+            {"serial": "Q2AP-0001", "productType": "wireless"},
+        ]
+
+        network_clients, _ = ClientGenerator(seed=5).generate_clients_for_network(
+            "N_1", vlans, 200, devices
+        )
+
+        category_by_index = {i: name for name, i in cg._USAGE_INDEX.items()}
+        seen = set()
+        for client in network_clients:
+            category = category_by_index[cg._usage_index_for(client["deviceTypePrediction"])]
+            pattern = cg.USAGE_PATTERNS[category]
+            usage = client["usage"]
+            assert pattern["sent_range"][0] <= usage["sent"] <= pattern["sent_range"][1]
+            assert pattern["recv_range"][0] <= usage["recv"] <= pattern["recv_range"][1]
+            assert usage["total"] == usage["sent"] + usage["recv"]
+            seen.add(category)
+
+        # Detailed predictions reach the specific categories, not just the Other fallback
+        assert {"Computer", "Phone"} <= seen
+
+
+class TestVlanWeight:
+    """Tests for weighting client VLAN picks."""
+
+    @pytest.mark.parametrize("name,weight", [
+        ("Corporate", 5), ("Data", 5), ("corp-wifi", 5),
+        ("Guest", 1), ("Voice", 1), ("IoT", 1), ("Management", 1),
+    ])
+    def test_weight_by_name(self, name, weight):
+        """Test corporate/data VLANs get the larger share."""
+        assert cg._vlan_weight({"name": name}) == weight
+
+    def test_unnamed_vlan(self):
+        """Test a VLAN without a name gets the base weight."""
+        assert cg._vlan_weight({}) == 1
+
+    def test_clients_favour_the_corporate_vlan(self):
+        """Test a network's clients split roughly 5:1 between a corporate and a guest VLAN."""
+        vlans = [
+            {"id": 10, "name": "Corporate", "subnet": "192.168.10.0/24"},
+            {"id": 20, "name": "Guest", "subnet": "192.168.20.0/24"},
+        ]
+        devices = [{"serial": "Q2SW-0001", "productType": "switch"}]
+
+        network_clients, _ = ClientGenerator(seed=1).generate_clients_for_network(
+            "N_1", vlans, 600, devices
+        )
+
+        corporate = [c for c in network_clients if c["vlan"] == "10"]
+        assert 0.75 < len(corporate) / len(network_clients) < 0.9
+        for client in network_clients:
+            assert client["ip"].startswith(f"192.168.{client['vlan']}.")
+
+
+class TestClientShape:
+    """Pin the key order of the network and device client dictionaries."""
+
+    def test_network_client_keys(self):
+        """Test network clients keep the Meraki field order."""
+        client = ClientGenerator(seed=1).generate_network_client(
+            "k1", "N_1", 10, 0, vlan_subnet="192.168.10.0/24"
+        )
+        assert list(client) == NETWORK_CLIENT_KEYS
+
+    def test_device_client_keys(self):
+        """Test device clients keep the reduced Meraki field order."""
+        client = ClientGenerator(seed=1).generate_device_client(
+            "k1", "N_1", 10, 0, "Q2XX-0000-0001", vlan_subnet="192.168.10.0/24"
+        )
+        assert list(client) == DEVICE_CLIENT_KEYS
+        assert list(client["usage"]) == ["sent", "recv"]
+
+    def test_batch_clients_share_the_same_shape(self):
+        """Test clients generated for a network have the same keys and consistent connections."""
+        devices = [
+            {"serial": "Q2SW-0001", "name": "SW1", "mac": "00:00:00:00:00:01", "productType": "switch"},
+            {"serial": "Q2AP-0001", "name": "AP1", "mac": "00:00:00:00:00:02", "productType": "wireless"},
+        ]
+        vlans = [{"id": 10, "name": "Corporate", "subnet": "192.168.10.0/24"}]
+
+        network_clients, device_clients = ClientGenerator(seed=7).generate_clients_for_network(
+            "N_1", vlans, 50, devices
+        )
+
+        assert set(device_clients) == {"Q2SW-0001", "Q2AP-0001"}
+        for client in network_clients:
+            assert list(client) == NETWORK_CLIENT_KEYS
+            if client["recentDeviceConnection"] == "Wired":
+                assert client["recentDeviceSerial"] == "Q2SW-0001"
+                assert client["ssid"] is None and client["wirelessCapabilities"] is None
+            else:
+                assert client["recentDeviceSerial"] == "Q2AP-0001"
+                assert client["switchport"] is None and client["ssid"] and client["wirelessCapabilities"]
+        for clients in device_clients.values():
+            for client in clients:
+                assert list(client) == DEVICE_CLIENT_KEYS
+
+    def test_devices_without_name_or_mac(self):
+        """Test a switch or AP without a name or MAC attaches clients with None for them."""
+        devices = [
+            {"serial": "Q2SW-0001", "productType": "switch"},
+            {"serial": "Q2AP-0001", "productType": "wireless"},
+        ]
+        vlans = [{"id": 10, "name": "Corporate", "subnet": "192.168.10.0/24"}]
+
+        network_clients, _ = ClientGenerator(seed=7).generate_clients_for_network(
+            "N_1", vlans, 20, devices
+        )
+
+        for client in network_clients:
+            assert client["recentDeviceSerial"] in {"Q2SW-0001", "Q2AP-0001"}
+            assert client["recentDeviceName"] is None
+            assert client["recentDeviceMac"] is None
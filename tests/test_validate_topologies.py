@@ -0,0 +1,188 @@
+"""
+Tests for scripts/validate_topologies.py (schema checks and the result cache).
+"""
+
+import importlib.util
+import json
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+_spec = importlib.util.spec_from_file_location(
+    "validate_topologies", PROJECT_ROOT / "scripts" / "validate_topologies.py"
+)
+validate_topologies = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(validate_topologies)
+
+HUB_SPOKE = "seed_data.topologies.hub_spoke.generate_hub_spoke_topology"
+
+
+def _topology(**overrides):
+    """Minimal topology that satisfies TOPOLOGY_SCHEMA."""
+    data = {
+        "topology_name": "test",
+        "organizations": [{"id": "1", "name": "Org", "url": "u", "api": {}, "cloud": {}}],
+        "networks": [{
+            "id": "N_1", "organizationId": "1", "name": "Net", "productTypes": [],
+            "timeZone": "UTC", "tags": [], "url": "u", "isBoundToConfigTemplate": False,
+        }],
+        "devices": [{
+            "serial": "Q2XX", "name": "SW", "model": "MS", "networkId": "N_1", "mac": "m",
+            "productType": "switch", "firmware": "f", "lanIp": "ip", "tags": [], "lat": 0, "lng": 0,
+        }],
+        "vlans": [{"id": 10, "networkId": "N_1", "name": "Corporate", "subnet": "s", "applianceIp": "ip"}],
+    }
+    data.update(overrides)
+    return data
+
+
+class TestValidator:
+    """Tests for the compiled TOPOLOGY_SCHEMA validator."""
+
+    def test_valid_topology_has_no_errors(self):
+        """Test a complete topology passes."""
+        assert list(validate_topologies.VALIDATOR(_topology())) == []
+
+    def test_reports_missing_and_empty_top_level_fields(self):
+        """Test missing and empty required sections are reported."""
+        data = _topology(vlans=[])
+        del data["devices"]
+
+        errors = list(validate_topologies.VALIDATOR(data))
+
+        assert 'Missing required field "devices"' in errors
+        assert 'Field "vlans" is empty' in errors
+
+    def test_checks_every_entity_not_just_the_first(self):
+        """Test a field missing from a later entity is still reported."""
+        data = _topology()
+        second = dict(data["vlans"][0], id=20)
+        del second["subnet"]
+        data["vlans"].append(second)
+
+        assert list(validate_topologies.VALIDATOR(data)) == ['VLAN missing field "subnet"']
+
+    @pytest.mark.parametrize("section,label,field", [
+        ("organizations", "Organization", "url"),
+        ("networks", "Network", "timeZone"),
+        ("devices", "Device", "firmware"),
+        ("vlans", "VLAN", "applianceIp"),
+    ])
+    def test_checks_the_last_entity_of_each_section(self, section, label, field):
+        """Test every entity section is checked through to its last entry."""
+        data = _topology()
+        entities = data[section]
+        entities.extend(dict(entities[0]) for _ in range(3))
+        del entities[-1][field]
+
+        assert list(validate_topologies.VALIDATOR(data)) == [f'{label} missing field "{field}"']
+
+    def test_reports_each_missing_field_once_in_schema_order(self):
+        """Test fields missing from several entities are reported once each, in schema order."""
+        data = _topology()
+        data["devices"] = [dict(data["devices"][0]) for _ in range(3)]
+        del data["devices"][1]["lanIp"]
+        del data["devices"][2]["lanIp"]
+        del data["devices"][2]["model"]
+
+        assert list(validate_topologies.VALIDATOR(data)) == [
+            'Device missing field "model"',
+            'Device missing field "lanIp"',
+        ]
+
+
+class TestValidateTopology:
+    """Tests for validating a single generated topology."""
+
+    def test_client_without_device_type_prediction(self):
+        """Test a client whose deviceTypePrediction is null passes without a warning."""
+        client = {
+            "id": "k1", "mac": "m", "ip": "ip", "description": "d", "manufacturer": "Apple",
+            "deviceTypePrediction": None, "status": "Online",
+        }
+        data = _topology(network_clients=[client])
+
+        errors, log = validate_topologies._validate_topology("x", lambda seed: data)
+
+        assert errors == []
+        assert "may not be in Meraki format" not in log
+
+
+class TestResultKey:
+    """Tests for the validation result cache key."""
+
+    def test_key_is_stable(self):
+        """Test the same sources and interpreter give the same key."""
+        func = validate_topologies.lazy_import(HUB_SPOKE)
+        assert validate_topologies._result_key(func) == validate_topologies._result_key(func)
+
+    def test_key_changes_with_interpreter_version(self, monkeypatch):
+        """Test a result recorded under one Python version is not reused by another."""
+        func = validate_topologies.lazy_import(HUB_SPOKE)
+        key = validate_topologies._result_key(func)
+
+        monkeypatch.setattr(sys, "version_info", (3, 10, 0, "final", 0))
+
+        assert validate_topologies._result_key(func) != key
+
+    def test_key_changes_with_interpreter_implementation(self, monkeypatch):
+        """Test a result recorded under CPython is not reused by PyPy."""
+        func = validate_topologies.lazy_import(HUB_SPOKE)
+        key = validate_topologies._result_key(func)
+
+        monkeypatch.setattr(sys, "implementation", types.SimpleNamespace(name="pypy"))
+
+        assert validate_topologies._result_key(func) != key
+
+
+class TestResultCache:
+    """Tests for skipping topologies that already passed."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        """Point the result cache at a temp dir and validate only hub_spoke."""
+        results_file = tmp_path / "results.json"
+        monkeypatch.setattr(validate_topologies, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(validate_topologies, "RESULTS_FILE", results_file)
+        monkeypatch.setattr(
+            validate_topologies, "discover_topologies",
+            lambda: [("hub_spoke", validate_topologies.lazy_import(HUB_SPOKE))],
+        )
+        return results_file
+
+    def _run(self, monkeypatch, errors=None):
+        """Run main() with a stub worker, returning how many topologies it validated."""
+        calls = []
+
+        def worker(args):
+            calls.append(args[0])
+            return list(errors or []), f"log for {args[0]}\n"
+
+        monkeypatch.setattr(validate_topologies, "_validate_worker", worker)
+        with pytest.raises(SystemExit):
+            validate_topologies.main()
+        return len(calls)
+
+    def test_miss_then_hit(self, cache, monkeypatch):
+        """Test a passing topology is validated once and replayed afterwards."""
+        assert self._run(monkeypatch) == 1
+        assert self._run(monkeypatch) == 0
+
+    def test_failures_are_not_cached(self, cache, monkeypatch):
+        """Test a failing topology is validated again on the next run."""
+        assert self._run(monkeypatch, errors=["hub_spoke: broken"]) == 1
+        assert self._run(monkeypatch) == 1
+
+    def test_stale_results_are_pruned(self, cache, monkeypatch):
+        """Test results for sources that no longer exist are dropped."""
+        cache.write_text(json.dumps({"stale-key": "old log\n"}))
+
+        self._run(monkeypatch)
+
+        results = json.loads(cache.read_text())
+        assert "stale-key" not in results
+        assert len(results) == 1